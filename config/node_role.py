@@ -15,9 +15,12 @@ Date: 2026-02-09
 """
 
 import os
+import zlib
+import random
+import functools
 from enum import Enum
 from typing import Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 class NodeRole(Enum):
@@ -34,6 +37,9 @@ class NodeRole(Enum):
 # Default role if environment variable not set
 DEFAULT_NODE_ROLE = NodeRole.DRONE  # Most nodes are drones
 
+# Value -> member lookup (avoids the ValueError path of NodeRole(value))
+_ROLE_MAP = {member.value: member for member in NodeRole}
+
 
 @dataclass
 class NodeConfig:
@@ -56,6 +62,25 @@ class NodeConfig:
     node_id: str = "NODE_UNKNOWN"
     heartbeat_interval_sec: int = 3600  # 1 hour default
     heartbeat_jitter_sec: int = 600  # 10 minutes jitter window
+    _jitter_float: float = field(init=False, repr=False, compare=False)
+    _base_offset: float = field(init=False, repr=False, compare=False)
+    
+    # Width of the random component added on top of the node's slot
+    JITTER_WINDOW_SEC = 30.0
+    
+    def __post_init__(self):
+        # Deterministic per-node slot inside the jitter window. crc32 is
+        # stable across processes (unlike hash()), so identical firmware
+        # booting with identical PRNG seeds still spreads out by node_id.
+        if self.heartbeat_jitter_sec > 0:
+            self._base_offset = float(
+                zlib.crc32(self.node_id.encode()) % self.heartbeat_jitter_sec
+            )
+        else:
+            self._base_offset = 0.0
+        # Precomputed so get_heartbeat_delay() is a single multiply-add
+        self._jitter_float = min(self.JITTER_WINDOW_SEC,
+                                 self.heartbeat_jitter_sec - self._base_offset)
     
     @property
     def is_queen(self) -> bool:
@@ -74,32 +99,37 @@ class NodeConfig:
         Problem: If 49 drones boot at sunrise (solar wake-up), they might
         all send heartbeat at the same second, causing packet collisions.
         
-        Solution: Add random jitter spread over 10 minutes (600s) to 
-        distribute the load.
+        Solution: Give each node a fixed slot in the 10 minute (600s)
+        window derived from its node_id, plus up to 30s of random jitter
+        within that slot. The slot spreads nodes even if their PRNGs are
+        seeded identically; the random part breaks ties between slots.
         
         Returns:
-            Random delay in seconds (0 to heartbeat_jitter_sec)
+            Delay in seconds (0 to heartbeat_jitter_sec)
         """
-        import random
-        return random.uniform(0, self.heartbeat_jitter_sec)
+        return self._base_offset + random.random() * self._jitter_float
 
 
+@functools.lru_cache(maxsize=None)
 def get_node_role() -> NodeRole:
     """
     Get node role from environment variable or default
     
     Environment variable: NODE_ROLE (QUEEN or DRONE)
     
+    The role is fixed for the lifetime of the process, so the lookup is
+    cached. Call _reset_env_cache() after changing the environment.
+    
     Returns:
         NodeRole enum value
     """
     role_str = os.getenv('NODE_ROLE', DEFAULT_NODE_ROLE.value).upper()
     
-    try:
-        return NodeRole(role_str)
-    except ValueError:
+    role = _ROLE_MAP.get(role_str)
+    if role is None:
         print(f"⚠️  Invalid NODE_ROLE '{role_str}', defaulting to {DEFAULT_NODE_ROLE.value}")
         return DEFAULT_NODE_ROLE
+    return role
 
 
 def create_node_config(
@@ -151,9 +181,10 @@ def create_node_config(
         )
 
 
+@functools.lru_cache(maxsize=None)
 def get_queen_node_id() -> Optional[str]:
     """
-    Get Queen node ID from environment variable
+    Get Queen node ID from environment variable (cached, see get_node_role)
     
     Environment variable: QUEEN_NODE_ID
     
@@ -163,6 +194,12 @@ def get_queen_node_id() -> Optional[str]:
     return os.getenv('QUEEN_NODE_ID')
 
 
+def _reset_env_cache() -> None:
+    """Drop cached NODE_ROLE / QUEEN_NODE_ID lookups (tests and demos)"""
+    get_node_role.cache_clear()
+    get_queen_node_id.cache_clear()
+
+
 # ============================================================================
 #  USAGE EXAMPLES
 # ============================================================================
@@ -174,6 +211,7 @@ if __name__ == "__main__":
     # Example 1: Queen Node
     print("\n📍 Example 1: Queen Node Configuration\n")
     os.environ['NODE_ROLE'] = 'QUEEN'
+    _reset_env_cache()
     
     queen_config = create_node_config(node_id="FOREST_A_QUEEN_001")
     
@@ -187,6 +225,7 @@ if __name__ == "__main__":
     print("\n📍 Example 2: Drone Node Configuration\n")
     os.environ['NODE_ROLE'] = 'DRONE'
     os.environ['QUEEN_NODE_ID'] = 'FOREST_A_QUEEN_001'
+    _reset_env_cache()
     
     drone_config = create_node_config(
         node_id="FOREST_A_DRONE_042",
@@ -5,10 +5,10 @@ The output of Phase-0 sensor fusion
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class EnvironmentalState:
     """
     Unified perceptual vector representing the current environmental state.
@@ -182,6 +182,14 @@ class EnvironmentalState:
     processing_time_ms: float = 0.0
     """Time taken for fusion processing (milliseconds)"""
     
+    temporal_metadata: Dict[str, Any] = field(default_factory=dict)
+    """
+    Temporal context attached by the Mamba fusion engine
+    (trend, persistence, chemical_trend, ...). Empty when fusion ran
+    without the temporal engine. Declared here because the class uses
+    __slots__ and cannot grow attributes at runtime.
+    """
+    
     # =========================================================================
     # METHODS: Utility Functions
     # =========================================================================
@@ -0,0 +1,38 @@
+"""
+OPTIONAL NUMBA JIT
+Shared shim for the small numeric kernels in the hot path
+
+When numba is installed, `njit` is numba.njit and kernels compile to
+machine code (cached on disk). Without numba the decorator is a no-op
+and the same kernels run as plain Python, so edge builds that cannot
+install LLVM still work.
+"""
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def njit(*args, **kwargs):
+    """
+    numba.njit when available, otherwise a no-op decorator
+    
+    cache=True is only honoured for package-qualified modules (core.x).
+    numba keys its on-disk cache by source file but records the importing
+    module's name, and core/ modules are also imported bare (tests put
+    core/ on sys.path); a cache written under one name fails to load
+    under the other.
+    """
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return njit()(args[0])
+
+    def decorator(func):
+        if not NUMBA_AVAILABLE:
+            return func
+        options = dict(kwargs)
+        if options.get('cache') and '.' not in func.__module__:
+            options['cache'] = False
+        return numba.njit(*args, **options)(func)
+    return decorator
@@ -0,0 +1,56 @@
+"""
+RING BUFFER
+Fixed-size float history for the windowed Phase-2/Phase-3 statistics
+
+Values live in a preallocated float64 array instead of a deque of
+Python objects, so appending allocates nothing and the window handed to
+the numeric kernels is already an ndarray.
+
+Every sample is written twice, at slot i and slot i + capacity. The
+newest `n` samples are then always one contiguous slice in arrival
+order, so reading the window needs no np.roll and no copy.
+"""
+
+import numpy as np
+
+
+class RingBuffer:
+    """Mirrored circular buffer of floats with a zero-copy window view"""
+
+    __slots__ = ('capacity', '_buf', '_i', '_n')
+
+    def __init__(self, capacity: int):
+        """
+        Args:
+            capacity: Maximum number of samples retained
+        """
+        self.capacity = capacity
+        self._buf = np.zeros(2 * capacity, dtype=np.float64)
+        self._i = 0  # Next write slot (0..capacity-1)
+        self._n = 0  # Samples currently held
+
+    def append(self, value: float):
+        """Add a sample, evicting the oldest once full"""
+        i = self._i
+        self._buf[i] = value
+        self._buf[i + self.capacity] = value
+        self._i = i + 1 if i + 1 < self.capacity else 0
+        if self._n < self.capacity:
+            self._n += 1
+
+    def view(self) -> np.ndarray:
+        """
+        Held samples, oldest first
+
+        Returns a view into the buffer: valid until the next append().
+        """
+        end = self._i + self.capacity
+        return self._buf[end - self._n:end]
+
+    def clear(self):
+        """Drop all samples"""
+        self._i = 0
+        self._n = 0
+
+    def __len__(self) -> int:
+        return self._n
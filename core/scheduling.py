@@ -0,0 +1,61 @@
+"""
+DEADLINE SCHEDULER
+Fixed-rate pacing for the monitoring loops
+
+Each loop asks for the delay until its next deadline instead of sleeping
+a fixed interval after the work, so the period is the requested interval
+rather than interval + compute time. A cycle that runs past its slot
+re-anchors the schedule rather than bursting to catch up.
+"""
+
+import logging
+import time
+
+
+class DeadlineScheduler:
+    """Monotonic deadline tracker shared by the monitoring loops"""
+
+    __slots__ = ('logger', 'unit', '_next_deadline', '_overruns')
+
+    # Consecutive overruns before the loop is reported as falling behind
+    OVERRUN_WARNING = 3
+
+    def __init__(self, logger: logging.Logger, unit: str = "cycles"):
+        """
+        Args:
+            logger: Logger that receives the overrun warning
+            unit: Name of one loop iteration in the warning ("cycles", ...)
+        """
+        self.logger = logger
+        self.unit = unit
+        self._next_deadline = time.monotonic()
+        self._overruns = 0
+
+    def delay(self, interval: float) -> float:
+        """
+        Advance to the next deadline and return how long to sleep
+
+        Args:
+            interval: Seconds between this iteration's deadline and the next
+
+        Returns:
+            Seconds to sleep (0.0 if the iteration overran its slot)
+        """
+        self._next_deadline += interval
+        sleep_for = self._next_deadline - time.monotonic()
+
+        if sleep_for > 0.0:
+            self._overruns = 0
+            return sleep_for
+
+        # Iteration ran past its slot: re-anchor instead of bursting to
+        # catch up
+        self._next_deadline = time.monotonic()
+        self._overruns += 1
+        if self._overruns == self.OVERRUN_WARNING:
+            self.logger.warning(
+                "Monitoring loop cannot keep up: %d consecutive %s "
+                "exceeded the %ss interval",
+                self.OVERRUN_WARNING, self.unit, interval
+            )
+        return 0.0
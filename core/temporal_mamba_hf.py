@@ -13,43 +13,103 @@ model's latent space, allowing the "Giant Brain" to process our signals.
 """
 
 import os
-import torch
-import torch.nn as nn
+import math
+import importlib.util
 import numpy as np
-from typing import Dict, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 from datetime import datetime
-from collections import deque
 
 try:
-    from transformers import MambaConfig, MambaModel, AutoTokenizer
-    HF_AVAILABLE = True
+    from core.jit import njit
 except ImportError:
-    HF_AVAILABLE = False
+    from jit import njit
 
+if TYPE_CHECKING:
+    import torch
+    import torch.nn as nn
 
-class MambaAdapter(nn.Module):
-    """
-    Neural Adapter to assume 3-channel sensor input into 768-dim Mamba space.
-    
-    Structure:
-    [Input: 3 dim] -> [Linear Projection] -> [Mamba-130m backbone] -> [Head] -> [Output: 1 dim]
-    """
-    def __init__(self, d_model=768):
-        super().__init__()
-        # Input projection: 3 sensors -> 768 dimensions
-        self.embedding = nn.Linear(3, d_model)
-        
-        # Output head: 768 dimensions -> 1 fused score
-        self.head = nn.Linear(d_model, 1)
-        
-        # Activation
-        self.activation = nn.GELU()
+# torch / transformers are imported on first MambaSSM_HF construction so
+# that nodes running the lightweight SSM never pay their import cost.
+HF_AVAILABLE = (importlib.util.find_spec('torch') is not None and
+                importlib.util.find_spec('transformers') is not None)
+
+torch = None
+nn = None
+
+
+def _import_torch():
+    """Bind the module-level torch / nn names on first use"""
+    global torch, nn
+    if torch is None:
+        import torch as _torch
+        import torch.nn as _nn
+        torch, nn = _torch, _nn
+
+
+@njit(cache=True)
+def _mean_delta_5(seq):
+    """Mean change across the 3 modalities over the last 5 rows"""
+    r = seq[-1]
+    p = seq[-5]
+    return ((r[0] - p[0]) + (r[1] - p[1]) + (r[2] - p[2])) / 3.0
+
+
+def _sigmoid(x: float) -> float:
+    """Numerically stable scalar logistic function"""
+    if x >= 0:
+        return 1.0 / (1.0 + math.exp(-x))
+    z = math.exp(x)
+    return z / (1.0 + z)
+
+
+_MambaAdapter = None
 
-    def forward(self, x):
-        # x shape: (Batch, Seq, 3)
-        embeddings = self.embedding(x)  # -> (Batch, Seq, 768)
-        embeddings = self.activation(embeddings)
-        return embeddings
+
+def _get_adapter_class():
+    """Define MambaAdapter on first use (needs torch.nn)"""
+    global _MambaAdapter
+    if _MambaAdapter is None:
+        _import_torch()
+
+        class MambaAdapter(nn.Module):
+            """
+            Neural Adapter to assume 3-channel sensor input into 768-dim Mamba space.
+
+            Structure:
+            [Input: 3 dim] -> [Linear Projection] -> [Mamba-130m backbone] -> [Head] -> [Output: 1 dim]
+            """
+            def __init__(self, d_model=768):
+                super().__init__()
+                # Input projection: 3 sensors -> 768 dimensions
+                self.embedding = nn.Linear(3, d_model)
+
+                # Output head: 768 dimensions -> 1 fused score
+                self.head = nn.Linear(d_model, 1)
+
+                # Activation
+                self.activation = nn.GELU()
+
+            def forward(self, x):
+                """
+                Project sensor inputs into the backbone's embedding space.
+
+                This is the only projection path; MambaSSM_HF.update() feeds its
+                output straight into the backbone via inputs_embeds.
+                """
+                # x shape: (Batch, Seq, 3)
+                embeddings = self.embedding(x)  # -> (Batch, Seq, 768)
+                embeddings = self.activation(embeddings)
+                return embeddings
+
+        _MambaAdapter = MambaAdapter
+    return _MambaAdapter
+
+
+def __getattr__(name):
+    # Keeps `from core.temporal_mamba_hf import MambaAdapter` working
+    if name == 'MambaAdapter':
+        return _get_adapter_class()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class MambaSSM_HF:
@@ -59,12 +119,24 @@ class MambaSSM_HF:
     API compatible with the lightweight MambaSSM for easy swapping.
     """
     
-    def __init__(self, model_path="models/mamba-130m", state_dim=8, learning_rate=0.01):
+    def __init__(self, model_path="models/mamba-130m", state_dim=8, learning_rate=0.01,
+                 quantize_backbone=True, compile_backbone=True):
         """
         Initialize Mamba HF Wrapper
+        
+        Args:
+            quantize_backbone: Apply dynamic int8 quantization to the frozen
+                backbone's Linear layers (CPU inference). The adapter
+                stays FP32 because it keeps training online.
+            compile_backbone: Specialize the steady-state (single token)
+                forward with torch.compile. Silently stays eager where
+                torch.compile is unsupported (some ARM edge builds).
         """
         if not HF_AVAILABLE:
             raise ImportError("transformers library not installed")
+        
+        _import_torch()
+        from transformers import MambaModel, AutoTokenizer
             
         print(f"🧠 LOADING MAMBA-130M (HF) from {model_path}...")
         
@@ -75,11 +147,10 @@ class MambaSSM_HF:
             self.config = self.model.config
             
             # Freeze the backbone (we only train the adapter for now to save compute)
-            for param in self.model.parameters():
-                param.requires_grad = False
+            self.model.requires_grad_(False)
                 
             # Initialize Adapter
-            self.adapter = MambaAdapter(d_model=self.config.d_model)
+            self.adapter = _get_adapter_class()(d_model=self.config.d_model)
             
             # Optimizer for adapter (online learning)
             self.optimizer = torch.optim.Adam(self.adapter.parameters(), lr=learning_rate)
@@ -88,6 +159,25 @@ class MambaSSM_HF:
             self.model.to(self.device)
             self.adapter.to(self.device)
             
+            # Inference mode for both modules, set once. If online adapter
+            # training is added, switch with train()/eval() around the step.
+            self.model.eval()
+            self.adapter.eval()
+            
+            if quantize_backbone:
+                self.model = self._quantize_backbone(self.model)
+            
+            # Compiled lazily on first call; only used for the fixed-shape
+            # (1, 1, d_model) steady-state step
+            self._compiled_model = None
+            if compile_backbone:
+                try:
+                    self._compiled_model = torch.compile(
+                        self.model, dynamic=False, mode="reduce-overhead"
+                    )
+                except Exception as e:
+                    print(f"⚠️  torch.compile unavailable, running eager: {e}")
+            
             print("✅ Mamba-130m Loaded & Adapter Initialized")
             self.model_ready = True
             
@@ -97,7 +187,21 @@ class MambaSSM_HF:
             raise e
             
         # State Management
-        self.history_buffer = deque(maxlen=60) # 60 second context window
+        # 60 second context window as a preallocated ring buffer
+        # (rows: ticks, cols: chemical/visual/environmental)
+        self.window_size = 60
+        # The NumPy ring shares storage with a preallocated (1, 60, 3)
+        # tensor, so model inputs are slices of it rather than new tensors
+        self._input_buf = torch.zeros(1, self.window_size, 3, dtype=torch.float32)
+        self._buf = self._input_buf[0].numpy()
+        self._idx = 0    # next write position
+        self._count = 0  # number of valid rows
+        
+        # Recurrent backbone state. The full window is only run once (cold
+        # start); afterwards each tick feeds a single token and carries
+        # the SSM/conv state forward.
+        self._cache = None
+        self._cache_position = 0
         self.current_state = {
             'fused_score': 0.0,
             'trend': 'stable',
@@ -119,51 +223,66 @@ class MambaSSM_HF:
         """
         # 1. Update History
         inputs = [chemical_score, visual_score, environmental_score]
-        self.history_buffer.append(inputs)
+        self._append(inputs)
         
         # Need at least a small sequence to run the model effectively
-        if len(self.history_buffer) < 5:
+        if self._count < 5:
             # Not enough data for meaningful inference yet
             return self._calculate_fallback_state(inputs, timestamp)
             
         # 2. Prepare Tensor (Batch=1, Seq=Len, Dim=3)
-        # Convert buffer to tensor
-        seq_data = list(self.history_buffer)
-        input_tensor = torch.tensor([seq_data], dtype=torch.float32).to(self.device)
+        if self._cache is None:
+            # Cold start: prime the recurrent state with the whole window
+            # (happens before the ring wraps, so rows 0..count are in order)
+            input_tensor = self._input_buf[:, :self._count, :].to(self.device)
+            cache_position = torch.arange(0, self.config.conv_kernel, device=self.device)
+        else:
+            # Steady state: only the newest tick is new information
+            last = (self._idx - 1) % self.window_size
+            input_tensor = self._input_buf[:, last:last + 1, :].to(self.device)
+            cache_position = torch.tensor([self._cache_position], device=self.device)
         
         # 3. Forward Pass
-        self.model.eval() # Inference mode
-        self.adapter.eval()
-        
-        with torch.no_grad():
-            # Project inputs to Mamba dimension
-            projected_inputs = self.adapter.embedding(input_tensor) # (1, L, 768)
+        with torch.inference_mode():
+            # Project inputs to Mamba dimension (Linear + GELU)
+            projected_inputs = self.adapter(input_tensor) # (1, L, 768)
             
-            # Run Mamba Backbone
-            outputs = self.model(inputs_embeds=projected_inputs)
+            # Run Mamba Backbone (stateful)
+            outputs = self._forward_backbone(projected_inputs, cache_position)
+            self._cache = outputs.cache_params
+            self._cache_position += input_tensor.shape[1]
             
             # Get last hidden state
             last_hidden_state = outputs.last_hidden_state[:, -1, :] # (1, 768)
             
             # Project to output score
             logits = self.adapter.head(last_hidden_state)
-            score = torch.sigmoid(logits).item() # 0.0 to 1.0
+            
+        # Single device->host read, sigmoid on the Python scalar
+        score = _sigmoid(logits.item()) # 0.0 to 1.0
             
         # 4. Compute Metadata (Trends/Lag) using Mamba's context
         # Ideally we'd extract this from the model's attention-like state, 
         # but for now we calculate from the buffer, enhanced by model's confidence.
         
+        seq_data = self._recent_window(10)
         trend = self._calculate_trend(seq_data)
-        confidence = 0.5 + (len(self.history_buffer) / 120.0) # Increases with context
+        confidence = 0.5 + (self._count / 120.0) # Increases with context
+        
+        # Population std of the 3 modality scores, no temporary array
+        mean_input = (chemical_score + visual_score + environmental_score) / 3.0
+        input_std = math.sqrt(((chemical_score - mean_input) ** 2 +
+                               (visual_score - mean_input) ** 2 +
+                               (environmental_score - mean_input) ** 2) / 3.0)
         
         self.current_state = {
             'fused_score': score,
             'trend': trend,
             'confidence': confidence,
-            'modality_agreement': 1.0 - np.std(inputs), # Simple variance
-            'chemical_trend': seq_data[-1][0] - seq_data[-5][0], # 5-step delta
-            'visual_trend': seq_data[-1][1] - seq_data[-5][1],
-            'persistence': np.mean([x[0] for x in list(self.history_buffer)[-10:]]), # 10-step mean chem
+            'modality_agreement': 1.0 - input_std, # Simple variance
+            'chemical_trend': float(seq_data[-1, 0] - seq_data[-5, 0]), # 5-step delta
+            'visual_trend': float(seq_data[-1, 1] - seq_data[-5, 1]),
+            'persistence': float(seq_data[-10:, 0].mean()), # 10-step mean chem
             'cross_modal_lag': 0.0, # Placeholder
             'temporal_features': {'model': 'mamba-130m-hf'}
         }
@@ -183,15 +302,107 @@ class MambaSSM_HF:
     def get_statistics(self) -> Dict:
         return {
             'updates': self.update_count,
-            'history_length': len(self.history_buffer),
+            'history_length': self._count,
             'backend': 'HuggingFace Mamba-130m'
         }
         
+    def warmup(self):
+        """
+        Trigger torch.compile on dummy inputs so the first live tick
+        does not pay for it.
+        
+        Runs a throwaway cold start and one steady-state step on a
+        scratch cache; the ring buffer and recurrent state are untouched.
+        """
+        if self._compiled_model is None:
+            return
+        
+        with torch.inference_mode():
+            prime = self.adapter(torch.zeros(1, 5, 3, device=self.device))
+            outputs = self.model(
+                inputs_embeds=prime,
+                use_cache=True,
+                cache_position=torch.arange(0, self.config.conv_kernel, device=self.device)
+            )
+            step = self.adapter(torch.zeros(1, 1, 3, device=self.device))
+            try:
+                self._compiled_model(
+                    inputs_embeds=step,
+                    cache_params=outputs.cache_params,
+                    use_cache=True,
+                    cache_position=torch.tensor([5], device=self.device)
+                )
+            except Exception as e:
+                print(f"⚠️  Compiled Mamba forward failed, running eager: {e}")
+                self._compiled_model = None
+    
+    def _forward_backbone(self, projected_inputs, cache_position):
+        """
+        Backbone forward; the compiled module serves the steady-state step
+        
+        Compilation happens on the first steady-state call. If it fails
+        there (unsupported backend/ops), fall back to eager for good.
+        """
+        model = self.model
+        if self._cache is not None and self._compiled_model is not None:
+            model = self._compiled_model
+        try:
+            return model(
+                inputs_embeds=projected_inputs,
+                cache_params=self._cache,
+                use_cache=True,
+                cache_position=cache_position
+            )
+        except Exception as e:
+            if model is self.model:
+                raise
+            print(f"⚠️  Compiled Mamba forward failed, running eager: {e}")
+            self._compiled_model = None
+            return self._forward_backbone(projected_inputs, cache_position)
+    
+    def _append(self, row):
+        """Write one (chemical, visual, environmental) row into the ring"""
+        self._buf[self._idx] = row
+        self._idx = (self._idx + 1) % self.window_size
+        self._count = min(self._count + 1, self.window_size)
+        
+    def _recent_window(self, n: int) -> np.ndarray:
+        """
+        Last n rows in chronological order.
+        
+        Returns a view when the rows are contiguous in the ring; only the
+        wrapped case copies (at most n rows).
+        """
+        n = min(n, self._count)
+        start = (self._idx - n) % self.window_size
+        if start + n <= self.window_size:
+            return self._buf[start:start + n]
+        return np.concatenate((self._buf[start:], self._buf[:self._idx]))
+        
+    @staticmethod
+    def _quantize_backbone(model):
+        """
+        Dynamic int8 quantization of the frozen backbone (CPU only).
+        
+        dt_proj is left in FP32: the Mamba mixer reads dt_proj.weight
+        directly, which a quantized Linear does not expose as a tensor.
+        Falls back to the FP32 model if the quantized engine is missing.
+        """
+        qconfig = torch.ao.quantization.default_dynamic_qconfig
+        spec = {
+            name: qconfig
+            for name, module in model.named_modules()
+            if isinstance(module, nn.Linear) and not name.endswith('dt_proj')
+        }
+        try:
+            return torch.ao.quantization.quantize_dynamic(model, spec, dtype=torch.qint8)
+        except (RuntimeError, AssertionError) as e:
+            print(f"⚠️  Backbone quantization unavailable ({e}), using FP32")
+            return model
+        
     def _calculate_trend(self, seq_data):
         """Simple trend calculation"""
-        recent = seq_data[-1]
-        past = seq_data[-5]
-        avg_change = np.mean(np.array(recent) - np.array(past))
+        avg_change = _mean_delta_5(seq_data)
         if avg_change > 0.05: return 'rising'
         if avg_change < -0.05: return 'falling'
         return 'stable'
@@ -199,7 +410,7 @@ class MambaSSM_HF:
     def _calculate_fallback_state(self, inputs, timestamp):
         """Fallback for initialization"""
         return {
-            'fused_score': np.mean(inputs),
+            'fused_score': (inputs[0] + inputs[1] + inputs[2]) / 3.0,
             'trend': 'stable',
             'confidence': 0.1
         }
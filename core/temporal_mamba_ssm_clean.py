@@ -16,14 +16,27 @@ Instead of asking "Is there fire NOW?", we ask:
 "What has been happening over the LAST 60 SECONDS?"
 """
 
+import math
 import numpy as np
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from collections import deque
+try:
+    from core.jit import njit, NUMBA_AVAILABLE
+except ImportError:
+    from jit import njit, NUMBA_AVAILABLE
 
 
-@dataclass
+# get_perceptual_score() trend labels, indexed by sign(avg_trend) + 1
+_TREND_LABELS = ("falling", "stable", "rising")
+
+# Working precision of the recurrence. Inputs and outputs are scores in
+# [0, 1], so float32 is ample and halves memory traffic per tick.
+SSM_DTYPE = np.float32
+
+
+@dataclass(slots=True)
 class TemporalState:
     """
     Hidden state of the Mamba SSM
@@ -34,7 +47,7 @@ class TemporalState:
     - Cross-sensor lag patterns (cause before effect)
     """
     # Hidden state vector (encodes temporal patterns)
-    h: np.ndarray = field(default_factory=lambda: np.zeros(8))
+    h: np.ndarray = field(default_factory=lambda: np.zeros(8, dtype=SSM_DTYPE))
     
     # Trend indicators
     chemical_trend: float = 0.0  # Rising/falling chemical signals
@@ -55,6 +68,292 @@ class TemporalState:
     timestamp: Optional[datetime] = None
 
 
+class HistoryRing:
+    """
+    Fixed-capacity history of SSM ticks, stored as parallel arrays
+    
+    Replaces a deque of per-tick dicts. Every row is written twice (slot i
+    and its mirror i + capacity), so any chronological window of the last
+    n ticks is a contiguous view - no copies, no per-tick allocation.
+    
+    Keeps the deque-style surface the SSM used before: len(), indexing and
+    iteration yield dict entries (built on demand), plus append()/clear().
+    """
+    
+    def __init__(self, capacity: int = 60, state_dim: int = 8):
+        self.capacity = capacity
+        self.inputs = np.zeros((2 * capacity, 3), dtype=SSM_DTYPE)
+        self.states = np.zeros((2 * capacity, state_dim), dtype=SSM_DTYPE)
+        self.trends = np.zeros((2 * capacity, 3), dtype=SSM_DTYPE)
+        self.timestamps = np.empty(2 * capacity, dtype=object)
+        self._head = 0   # next write slot in [0, capacity)
+        self._count = 0  # number of valid ticks
+    
+    def push(self, timestamp, inputs, state, trends):
+        """Record one tick (copies into the preallocated rows)"""
+        for i in (self._head, self._head + self.capacity):
+            self.inputs[i] = inputs
+            self.states[i] = state
+            self.trends[i] = trends
+            self.timestamps[i] = timestamp
+        self._head = (self._head + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+    
+    def _window(self, n: int) -> slice:
+        """Rows holding the last n ticks, oldest first"""
+        end = self._head + self.capacity
+        return slice(end - min(n, self._count), end)
+    
+    def recent_inputs(self, n: int) -> np.ndarray:
+        """(n, 3) view of the last n input rows"""
+        return self.inputs[self._window(n)]
+    
+    def recent_states(self, n: int) -> np.ndarray:
+        """(n, state_dim) view of the last n hidden states"""
+        return self.states[self._window(n)]
+    
+    def last_inputs(self) -> np.ndarray:
+        """Inputs of the newest tick"""
+        return self.inputs[self._head + self.capacity - 1]
+    
+    def append(self, entry: Dict):
+        """Deque-compatible append of a dict entry (missing fields -> 0)"""
+        self.push(
+            entry.get('timestamp'),
+            entry.get('inputs', 0.0),
+            entry.get('state', 0.0),
+            [entry.get('chemical_trend', 0.0),
+             entry.get('visual_trend', 0.0),
+             entry.get('environmental_trend', 0.0)]
+        )
+    
+    def clear(self):
+        self._head = 0
+        self._count = 0
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def __getitem__(self, index: int) -> Dict:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("history index out of range")
+        row = self._window(self._count).start + index
+        return {
+            'timestamp': self.timestamps[row],
+            'inputs': self.inputs[row].copy(),
+            'state': self.states[row].copy(),
+            'chemical_trend': float(self.trends[row, 0]),
+            'visual_trend': float(self.trends[row, 1]),
+            'environmental_trend': float(self.trends[row, 2])
+        }
+    
+    def __iter__(self):
+        return (self[i] for i in range(self._count))
+
+
+# =============================================================================
+# JIT KERNELS: pure functions on small arrays, compiled with numba when
+# available. MambaSSM's helpers gather their inputs and delegate here.
+# =============================================================================
+
+@njit(cache=True)
+def _fast_sigmoid(z):
+    """
+    Logistic sigmoid without exp: 0.5 + 0.5*tanh(z/2), with tanh replaced
+    by its [5/4] Padé approximant (clamped to [-1, 1])
+    
+    Abs. error ~9e-13 on the gate's input range z = 5*(var - 0.1) in
+    [-0.5, 0.75], < 1.4e-9 for |z| <= 1.5 and < 7e-4 everywhere.
+    """
+    x = 0.5 * z
+    x2 = x * x
+    t = x * (945.0 + 105.0 * x2 + x2 * x2) / (945.0 + 420.0 * x2 + 15.0 * x2 * x2)
+    return 0.5 + 0.5 * min(1.0, max(-1.0, t))
+
+
+@njit(cache=True)
+def _selection_kernel(inputs, input_variance):
+    """Variance-gated input selection (weights are folded into B_eff)"""
+    selected = np.empty(3)
+    for j in range(3):
+        gate = _fast_sigmoid(5.0 * (input_variance[j] - 0.1))
+        selected[j] = inputs[j] * gate
+    return selected
+
+
+@njit(cache=True)
+def _ewm_update(ema, emv, x, alpha):
+    """
+    In-place exponentially weighted mean/variance (incremental Welford form)
+    
+    delta = x - ema; ema += alpha*delta; emv = (1-alpha)*(emv + alpha*delta^2)
+    """
+    delta = x - ema
+    ema += alpha * delta
+    emv *= 1.0 - alpha
+    emv += (1.0 - alpha) * alpha * delta * delta
+
+
+@njit(cache=True)
+def _transition_kernel(h_prev, u, dt, A, B):
+    """
+    h(t) = tanh(h(t-1) + dt * A h(t-1) + B u(t))
+    
+    Written out as loops: at state_dim=8 this compiles to a few dozen
+    FMAs with a single output allocation.
+    """
+    n = h_prev.shape[0]
+    h_new = np.empty_like(h_prev)
+    for i in range(n):
+        acc = 0.0
+        for j in range(n):
+            acc += A[i, j] * h_prev[j]
+        acc = h_prev[i] + dt * acc
+        for k in range(u.shape[0]):
+            acc += B[i, k] * u[k]
+        h_new[i] = np.tanh(acc)
+    return h_new
+
+
+@njit(cache=True)
+def _trend_kernel(trends, inputs, prev_inputs, alpha):
+    """In-place EMA of the per-modality input delta"""
+    trends += alpha * ((inputs - prev_inputs) - trends)
+
+
+@njit(cache=True)
+def _persistence_kernel(value, prev, threshold, decay):
+    """Grow persistence while elevated, decay otherwise"""
+    if value > threshold:
+        return min(1.0, prev + 0.05)
+    return prev * decay
+
+
+@njit(cache=True)
+def _confidence_kernel(history_len, ema_state, emv_state, chemical_trend, visual_trend):
+    """Blend of history length, state stability and trend clarity"""
+    history_factor = min(1.0, history_len / 30.0)
+    if history_len > 5:
+        # Pooled variance over time and state dims: mean temporal variance
+        # per dim plus spread of the per-dim means (law of total variance)
+        state_variance = np.mean(emv_state) + np.var(ema_state)
+        stability_factor = 1.0 / (1.0 + state_variance)
+    else:
+        stability_factor = 0.5
+    clarity_factor = min(1.0, abs(chemical_trend) + abs(visual_trend))
+    return 0.4 * history_factor + 0.4 * stability_factor + 0.2 * clarity_factor
+
+
+@njit(cache=True)
+def _scan_kernel(inputs, dts, A, B_eff, C, h, ema_in, emv_in, ema_st, emv_st,
+                 trend_vec, scalars, ring_inputs, ring_states, ring_trends,
+                 counters, chem_flags, vis_flags, fused_out):
+    """
+    update() followed by get_perceptual_score(), for every row of inputs
+    
+    All state is updated in place:
+        scalars: [chemical_persistence, visual_persistence, cross_modal_lag,
+                  temporal_confidence, chemical_trend, visual_trend,
+                  environmental_trend]
+        counters: [ring head, ring count, tick]
+        chem_flags / vis_flags: spike flag per tick, indexed tick % capacity
+    """
+    capacity = ring_inputs.shape[0] // 2
+    head = counters[0]
+    count = counters[1]
+    tick = counters[2]
+    h_cur = h.copy()
+    
+    for t in range(inputs.shape[0]):
+        x = inputs[t]
+        
+        # Selection + state transition
+        u = _selection_kernel(x, emv_in)
+        h_new = _transition_kernel(h_cur, u, dts[t], A, B_eff)
+        
+        # Trends
+        if count > 0:
+            _trend_kernel(trend_vec, x, ring_inputs[head + capacity - 1], 0.1)
+            chemical_trend = trend_vec[0]
+            visual_trend = trend_vec[1]
+            environmental_trend = trend_vec[2]
+        else:
+            chemical_trend = 0.0
+            visual_trend = 0.0
+            environmental_trend = 0.0
+        
+        # Persistence
+        chem_persist = _persistence_kernel(x[0], scalars[0], 0.5, 0.95)
+        vis_persist = _persistence_kernel(x[1], scalars[1], 0.5, 0.95)
+        
+        # Cross-modal lag: first spikes among the ticks in the window
+        lag = 0.0
+        if count >= 20:
+            first_chemical = -1
+            first_visual = -1
+            for k in range(max(0, tick - capacity), tick):
+                if first_chemical < 0 and chem_flags[k % capacity]:
+                    first_chemical = k
+                if first_visual < 0 and vis_flags[k % capacity]:
+                    first_visual = k
+            if first_chemical >= 0 and first_visual >= 0:
+                lag = float(first_visual - first_chemical)
+        
+        # Confidence (previous tick's trends, as in update())
+        confidence = _confidence_kernel(count, ema_st, emv_st, scalars[4], scalars[5])
+        
+        # Spike flags, then running moments, then history
+        slot = tick % capacity
+        chem_flags[slot] = x[0] > ema_in[0] + np.sqrt(emv_in[0])
+        vis_flags[slot] = x[1] > ema_in[1] + np.sqrt(emv_in[1])
+        tick += 1
+        
+        if count == 0:
+            ema_in[:] = x
+            emv_in[:] = 0.0
+            ema_st[:] = h_new
+            emv_st[:] = 0.0
+        else:
+            _ewm_update(ema_in, emv_in, x, 0.1)
+            _ewm_update(ema_st, emv_st, h_new, 1.0 / 3.0)
+        
+        for i in (head, head + capacity):
+            ring_inputs[i] = x
+            ring_states[i] = h_new
+            ring_trends[i, 0] = chemical_trend
+            ring_trends[i, 1] = visual_trend
+            ring_trends[i, 2] = environmental_trend
+        head = (head + 1) % capacity
+        count = min(count + 1, capacity)
+        
+        h_cur = h_new
+        scalars[0] = chem_persist
+        scalars[1] = vis_persist
+        scalars[2] = lag
+        scalars[3] = confidence
+        scalars[4] = chemical_trend
+        scalars[5] = visual_trend
+        scalars[6] = environmental_trend
+        
+        # Fused score (mirrors get_perceptual_score)
+        base = 0.0
+        for i in range(h_cur.shape[0]):
+            base += C[0, i] * h_cur[i]
+        fused = (np.tanh(base) + 1.0) / 2.0
+        fused += 0.1 * (chemical_trend > 0.1) + 0.05 * (visual_trend > 0.1)
+        fused += chem_persist * 0.1 + vis_persist * 0.05
+        if 10.0 < lag < 30.0:
+            fused += 0.15
+        fused_out[t] = min(1.0, max(0.0, fused))
+    
+    h[:] = h_cur
+    counters[0] = head
+    counters[1] = count
+    counters[2] = tick
+
+
 class MambaSSM:
     """
     Mamba State Space Model for temporal coherence
@@ -82,22 +381,103 @@ class MambaSSM:
         self.learning_rate = learning_rate
         
         # State space matrices (initialized randomly, adapted online)
-        self.A = np.eye(state_dim) * 0.9  # State transition (decay)
-        self.B = np.random.randn(state_dim, 3) * 0.1  # Input projection
-        self.C = np.random.randn(1, state_dim) * 0.1  # Output projection
+        self.A = (np.eye(state_dim) * 0.9).astype(SSM_DTYPE)  # State transition (decay)
+        self._B = (np.random.randn(state_dim, 3) * 0.1).astype(SSM_DTYPE)  # Input projection
+        self.C = (np.random.randn(1, state_dim) * 0.1).astype(SSM_DTYPE)  # Output projection
         
         # Selection mechanism (learns which inputs matter)
-        self.selection_weights = np.ones(3) / 3.0  # Start equal
+        self._selection_weights = np.full(3, 1.0 / 3.0, dtype=SSM_DTYPE)  # Start equal
+        
+        # B with the selection weights folded in (B @ (w * u) == B_eff @ u);
+        # refreshed whenever B or selection_weights is reassigned
+        self._refresh_B_eff()
         
         # Current hidden state
         self.state = TemporalState()
         
         # History buffer (last 60 seconds at 1 Hz)
-        self.history_buffer = deque(maxlen=60)
+        self.history_buffer = HistoryRing(capacity=60, state_dim=state_dim)
+        
+        # Running moments, updated in O(1) per tick instead of re-scanning
+        # the history: inputs (~10-tick window) and hidden state (~5-tick)
+        self._reset_moments()
+        
+        # Tick indices of chemical/visual spikes still inside the window,
+        # maintained incrementally for the cross-modal lag
+        self._tick = 0
+        self._chem_spikes = deque()
+        self._vis_spikes = deque()
         
         # Statistics
         self.update_count = 0
     
+    @property
+    def B(self) -> np.ndarray:
+        """Input projection (state_dim, 3)"""
+        return self._B
+    
+    @B.setter
+    def B(self, value: np.ndarray):
+        self._B = value
+        self._refresh_B_eff()
+    
+    @property
+    def selection_weights(self) -> np.ndarray:
+        """
+        Per-modality input weights. Assign a new array to change them;
+        in-place edits are not seen by the cached B_eff.
+        """
+        return self._selection_weights
+    
+    @selection_weights.setter
+    def selection_weights(self, value: np.ndarray):
+        self._selection_weights = value
+        self._refresh_B_eff()
+    
+    def _refresh_B_eff(self):
+        """Recompute B_eff = B * selection_weights (column scaling)"""
+        self._B_eff = self._B * self._selection_weights[None, :]
+    
+    def _reset_moments(self):
+        """Reset the exponentially weighted input/state moments"""
+        self._ema_inputs = np.zeros(3, dtype=SSM_DTYPE)
+        self._emv_inputs = np.ones(3, dtype=SSM_DTYPE)  # "no history" opens the gate
+        self._ema_state = np.zeros(self.state_dim, dtype=SSM_DTYPE)
+        self._emv_state = np.zeros(self.state_dim, dtype=SSM_DTYPE)
+        self._trend_vec = np.zeros(3, dtype=SSM_DTYPE)  # EMA of input deltas
+    
+    def _update_moments(self, inputs: np.ndarray, h: np.ndarray):
+        """Fold one tick into the running moments (call before push)"""
+        if len(self.history_buffer) == 0:
+            self._ema_inputs[:] = inputs
+            self._emv_inputs[:] = 0.0
+            self._ema_state[:] = h
+            self._emv_state[:] = 0.0
+            return
+        _ewm_update(self._ema_inputs, self._emv_inputs, inputs, 0.1)
+        _ewm_update(self._ema_state, self._emv_state, h, 1.0 / 3.0)
+    
+    def _track_spikes(self, inputs: np.ndarray):
+        """
+        Record whether this tick is a chemical/visual spike (call before
+        _update_moments, so the threshold reflects the history only)
+        
+        A spike is a sample above the running mean + one std. Indices that
+        fall out of the history window are evicted.
+        """
+        tick = self._tick
+        if inputs[0] > self._ema_inputs[0] + np.sqrt(self._emv_inputs[0]):
+            self._chem_spikes.append(tick)
+        if inputs[1] > self._ema_inputs[1] + np.sqrt(self._emv_inputs[1]):
+            self._vis_spikes.append(tick)
+        
+        oldest = tick - self.history_buffer.capacity + 1
+        while self._chem_spikes and self._chem_spikes[0] < oldest:
+            self._chem_spikes.popleft()
+        while self._vis_spikes and self._vis_spikes[0] < oldest:
+            self._vis_spikes.popleft()
+        self._tick = tick + 1
+    
     def _selection_mechanism(self, inputs: np.ndarray, dt: float) -> np.ndarray:
         """
         Selective gating: decide which inputs to let through
@@ -111,25 +491,13 @@ class MambaSSM:
             dt: Time delta since last update
         
         Returns:
-            Gated inputs
+            Gated inputs (selection weights are applied through B_eff
+            in the state transition)
         """
-        # Compute input variance (are things changing?)
-        if len(self.history_buffer) > 0:
-            # Convert deque to list for slicing
-            buffer_list = list(self.history_buffer)
-            recent_inputs = np.array([h['inputs'] for h in buffer_list[-10:]])
-            input_variance = np.var(recent_inputs, axis=0)
-        else:
-            input_variance = np.ones(3)
-        
+        # Input variance, ~10-tick EMV (are things changing?)
         # High variance → open gate (things are changing, pay attention)
         # Low variance → close gate (stable, ignore noise)
-        gate = 1.0 / (1.0 + np.exp(-5 * (input_variance - 0.1)))
-        
-        # Apply selection
-        selected = inputs * gate * self.selection_weights
-        
-        return selected
+        return _selection_kernel(inputs, self._emv_inputs)
     
     def _state_transition(self, h_prev: np.ndarray, u: np.ndarray, dt: float) -> np.ndarray:
         """
@@ -139,28 +507,29 @@ class MambaSSM:
         
         Args:
             h_prev: Previous hidden state
-            u: Selected input
+            u: Gated input (selection weights applied via B_eff)
             dt: Time delta
         
         Returns:
             New hidden state
         """
         # Discretize continuous-time dynamics
-        # h(t) = exp(A * dt) * h(t-1) + B * u(t)
-        A_discrete = np.eye(self.state_dim) + self.A * dt
-        
-        h_new = A_discrete @ h_prev + self.B @ u
-        
-        # Normalize to prevent explosion
-        h_new = np.tanh(h_new)
-        
+        # h(t) = exp(A * dt) * h(t-1) + B * u(t) ≈ h + dt*A*h + B*u,
+        # tanh to prevent explosion
+        if NUMBA_AVAILABLE:
+            return _transition_kernel(h_prev, u, dt, self.A, self._B_eff)
+        
+        # Interpreted fallback: same update without the identity temporary
+        h_new = h_prev + dt * (self.A @ h_prev) + self._B_eff @ u
+        np.tanh(h_new, out=h_new)
         return h_new
     
     def _compute_trends(self, inputs: np.ndarray) -> Tuple[float, float, float]:
         """
         Compute trend indicators (rising/falling)
         
-        Uses exponential moving average to track direction.
+        Uses exponential moving average to track direction. Advances the
+        running EMA, so call it once per tick.
         
         Args:
             inputs: [chemical, visual, environmental]
@@ -171,26 +540,12 @@ class MambaSSM:
         alpha = 0.1  # Smoothing factor
         
         if len(self.history_buffer) > 0:
-            prev_inputs = self.history_buffer[-1]['inputs']
-            
-            # Compute delta
-            delta = inputs - prev_inputs
-            
-            # Smooth with EMA
-            prev_trends = [
-                self.state.chemical_trend,
-                self.state.visual_trend,
-                self.state.environmental_trend
-            ]
-            
-            trends = [
-                alpha * delta[i] + (1 - alpha) * prev_trends[i]
-                for i in range(3)
-            ]
-        else:
-            trends = [0.0, 0.0, 0.0]
+            # Smooth the delta with EMA (maintained in self._trend_vec)
+            _trend_kernel(self._trend_vec, inputs,
+                          self.history_buffer.last_inputs(), alpha)
+            return tuple(self._trend_vec.tolist())
         
-        return tuple(trends)
+        return (0.0, 0.0, 0.0)
     
     def _compute_persistence(self, inputs: np.ndarray) -> Tuple[float, float]:
         """
@@ -208,17 +563,12 @@ class MambaSSM:
         threshold = 0.5  # Signal considered "elevated" above this
         decay = 0.95  # Decay rate for persistence
         
-        # Chemical persistence
-        if inputs[0] > threshold:
-            chem_persist = min(1.0, self.state.chemical_persistence + 0.05)
-        else:
-            chem_persist = self.state.chemical_persistence * decay
-        
-        # Visual persistence
-        if inputs[1] > threshold:
-            vis_persist = min(1.0, self.state.visual_persistence + 0.05)
-        else:
-            vis_persist = self.state.visual_persistence * decay
+        chem_persist = _persistence_kernel(
+            float(inputs[0]), self.state.chemical_persistence, threshold, decay
+        )
+        vis_persist = _persistence_kernel(
+            float(inputs[1]), self.state.visual_persistence, threshold, decay
+        )
         
         return chem_persist, vis_persist
     
@@ -235,38 +585,10 @@ class MambaSSM:
         if len(self.history_buffer) < 20:
             return 0.0
         
-        # Extract recent chemical and visual trends
-        chemical_values = []
-        visual_values = []
-        
-        for entry in self.history_buffer:
-            chemical_values.append(entry['inputs'][0])
-            visual_values.append(entry['inputs'][1])
-        
-        chemical_values = np.array(chemical_values)
-        visual_values = np.array(visual_values)
-        
-        # Find peaks/spikes
-        chemical_threshold = np.mean(chemical_values) + np.std(chemical_values)
-        visual_threshold = np.mean(visual_values) + np.std(visual_values)
-        
-        chemical_spike_times = []
-        visual_spike_times = []
-        
-        for i, entry in enumerate(self.history_buffer):
-            if chemical_values[i] > chemical_threshold:
-                chemical_spike_times.append(i)
-            if visual_values[i] > visual_threshold:
-                visual_spike_times.append(i)
-        
-        # Compute typical lag
-        if len(chemical_spike_times) > 0 and len(visual_spike_times) > 0:
-            first_chemical_spike = min(chemical_spike_times)
-            first_visual_spike = min(visual_spike_times)
-            
+        # First spike of each modality still in the window (see _track_spikes)
+        if self._chem_spikes and self._vis_spikes:
             # Positive lag = chemical leads
-            lag = first_visual_spike - first_chemical_spike
-            return float(lag)
+            return float(self._vis_spikes[0] - self._chem_spikes[0])
         
         return 0.0
     
@@ -286,26 +608,12 @@ class MambaSSM:
             Confidence score (0.0-1.0)
         """
         # History factor (more data = more confidence)
-        history_factor = min(1.0, len(self.history_buffer) / 30.0)
-        
         # State stability (lower variance = more confidence)
-        if len(self.history_buffer) > 5:
-            # Convert deque to list for slicing
-            buffer_list = list(self.history_buffer)
-            recent_states = [entry['state'] for entry in buffer_list[-5:]]
-            state_variance = np.var(recent_states)
-            stability_factor = 1.0 / (1.0 + state_variance)
-        else:
-            stability_factor = 0.5
-        
         # Pattern clarity (strong trends = more confidence)
-        trend_magnitude = abs(self.state.chemical_trend) + abs(self.state.visual_trend)
-        clarity_factor = min(1.0, trend_magnitude)
-        
-        # Combine factors
-        confidence = 0.4 * history_factor + 0.4 * stability_factor + 0.2 * clarity_factor
-        
-        return confidence
+        return _confidence_kernel(
+            len(self.history_buffer), self._ema_state, self._emv_state,
+            self.state.chemical_trend, self.state.visual_trend
+        )
     
     def update(self, 
                chemical_score: float, 
@@ -326,8 +634,9 @@ class MambaSSM:
         Returns:
             Updated temporal state
         """
-        # Prepare input vector
-        inputs = np.array([chemical_score, visual_score, environmental_score])
+        # Prepare input vector (SSM_DTYPE whatever the callers pass)
+        inputs = np.array([chemical_score, visual_score, environmental_score],
+                          dtype=SSM_DTYPE)
         
         # Compute time delta
         if self.state.timestamp is not None:
@@ -361,15 +670,10 @@ class MambaSSM:
             timestamp=timestamp
         )
         
-        # Store in history
-        self.history_buffer.append({
-            'timestamp': timestamp,
-            'inputs': inputs,
-            'state': h_new.copy(),
-            'chemical_trend': trends[0],
-            'visual_trend': trends[1],
-            'environmental_trend': trends[2]
-        })
+        # Store in history (copied into the ring's preallocated rows)
+        self._track_spikes(inputs)
+        self._update_moments(inputs, h_new)
+        self.history_buffer.push(timestamp, inputs, h_new, trends)
         
         # Update internal state
         self.state = new_state
@@ -377,6 +681,96 @@ class MambaSSM:
         
         return new_state
     
+    def update_batch(self,
+                     chemical_scores,
+                     visual_scores,
+                     environmental_scores,
+                     timestamps) -> np.ndarray:
+        """
+        Replay a whole trajectory (offline / backtesting)
+        
+        Same result as calling update() and then get_perceptual_score()
+        for each tick, but the loop runs in one compiled kernel instead of
+        paying Python dispatch per tick. The SSM is left in the state the
+        last update() would have produced.
+        
+        Args:
+            chemical_scores, visual_scores, environmental_scores: (N,) arrays
+            timestamps: N datetimes (or datetime64 values)
+        
+        Returns:
+            (N,) array of fused scores
+        """
+        inputs = np.column_stack(
+            (chemical_scores, visual_scores, environmental_scores)
+        ).astype(SSM_DTYPE)
+        n = inputs.shape[0]
+        if n == 0:
+            return np.empty(0)
+        
+        # Time deltas, clamped as in update()
+        ts = np.asarray(timestamps, dtype='datetime64[us]')
+        dts = np.empty(n)
+        dts[1:] = np.diff(ts) / np.timedelta64(1, 's')
+        last_timestamp = timestamps[-1]
+        if not isinstance(last_timestamp, datetime):
+            last_timestamp = ts[-1].item()
+        if self.state.timestamp is not None:
+            dts[0] = (ts[0] - np.datetime64(self.state.timestamp, 'us')) / np.timedelta64(1, 's')
+        else:
+            dts[0] = 1.0
+        np.clip(dts, 0.1, 10.0, out=dts)
+        
+        ring = self.history_buffer
+        capacity = ring.capacity
+        state = self.state
+        h = np.array(state.h, dtype=SSM_DTYPE)
+        scalars = np.array([
+            state.chemical_persistence, state.visual_persistence,
+            state.cross_modal_lag, state.temporal_confidence,
+            state.chemical_trend, state.visual_trend, state.environmental_trend
+        ])
+        head0 = ring._head
+        counters = np.array([head0, ring._count, self._tick], dtype=np.int64)
+        chem_flags = np.zeros(capacity, dtype=np.bool_)
+        vis_flags = np.zeros(capacity, dtype=np.bool_)
+        chem_flags[np.fromiter(self._chem_spikes, np.int64) % capacity] = True
+        vis_flags[np.fromiter(self._vis_spikes, np.int64) % capacity] = True
+        fused = np.empty(n)
+        
+        _scan_kernel(inputs, dts, self.A, self._B_eff, self.C, h,
+                     self._ema_inputs, self._emv_inputs,
+                     self._ema_state, self._emv_state, self._trend_vec,
+                     scalars, ring.inputs, ring.states, ring.trends,
+                     counters, chem_flags, vis_flags, fused)
+        
+        # Write back what the kernel tracked in flat arrays
+        ring._head, ring._count, self._tick = (int(c) for c in counters)
+        for k in range(max(0, n - capacity), n):
+            slot = (head0 + k) % capacity
+            ring.timestamps[slot] = ring.timestamps[slot + capacity] = (
+                timestamps[k] if k < n - 1 else last_timestamp
+            )
+        window = np.arange(max(0, self._tick - capacity), self._tick)
+        slots = window % capacity
+        self._chem_spikes = deque(window[chem_flags[slots]].tolist())
+        self._vis_spikes = deque(window[vis_flags[slots]].tolist())
+        
+        self.state = TemporalState(
+            h=h,
+            chemical_trend=float(scalars[4]),
+            visual_trend=float(scalars[5]),
+            environmental_trend=float(scalars[6]),
+            chemical_persistence=float(scalars[0]),
+            visual_persistence=float(scalars[1]),
+            cross_modal_lag=float(scalars[2]),
+            temporal_confidence=float(scalars[3]),
+            timestamp=last_timestamp
+        )
+        self.update_count += n
+        
+        return fused
+    
     def get_perceptual_score(self) -> Dict:
         """
         Get current perceptual score (what Phase-0 outputs)
@@ -387,70 +781,66 @@ class MambaSSM:
         Returns:
             Perceptual state dict
         """
+        state = self.state
+        
         # Base score from hidden state
         # Ensure result is scalar
-        base_score_raw = self.C @ self.state.h
+        base_score_raw = self.C @ state.h
         if isinstance(base_score_raw, np.ndarray):
             base_score = float(base_score_raw.item())
         else:
             base_score = float(base_score_raw)
-        base_score = (np.tanh(base_score) + 1.0) / 2.0  # Normalize to [0, 1]
+        base_score = (math.tanh(base_score) + 1.0) / 2.0  # Normalize to [0, 1]
+        
+        chemical_trend = state.chemical_trend
+        visual_trend = state.visual_trend
+        environmental_trend = state.environmental_trend
         
         # Trend adjustment (rising trends increase score)
-        trend_boost = 0.0
-        if self.state.chemical_trend > 0.1:
-            trend_boost += 0.1
-        if self.state.visual_trend > 0.1:
-            trend_boost += 0.05
+        trend_boost = 0.1 * (chemical_trend > 0.1) + 0.05 * (visual_trend > 0.1)
         
         # Persistence adjustment (sustained signals increase score)
         persistence_boost = (
-            self.state.chemical_persistence * 0.1 +
-            self.state.visual_persistence * 0.05
+            state.chemical_persistence * 0.1 +
+            state.visual_persistence * 0.05
         )
         
         # Cross-modal lag adjustment
         # If chemical leads vision by 10-30 seconds, this is fire pattern
-        lag_boost = 0.0
-        if 10 < self.state.cross_modal_lag < 30:
-            lag_boost = 0.15  # Strong fire signature
+        lag_boost = 0.15 * (10 < state.cross_modal_lag < 30)  # Strong fire signature
         
         # Final fused score
         fused_score = base_score + trend_boost + persistence_boost + lag_boost
         fused_score = min(1.0, max(0.0, fused_score))  # Clamp
         
-        # Determine trend direction
+        # Determine trend direction: -1/0/+1 from the two thresholds
         avg_trend = (
-            self.state.chemical_trend * 0.5 +
-            self.state.visual_trend * 0.3 +
-            self.state.environmental_trend * 0.2
+            chemical_trend * 0.5 +
+            visual_trend * 0.3 +
+            environmental_trend * 0.2
         )
-        
-        if avg_trend > 0.05:
-            trend = "rising"
-        elif avg_trend < -0.05:
-            trend = "falling"
-        else:
-            trend = "stable"
+        trend = _TREND_LABELS[(avg_trend > 0.05) - (avg_trend < -0.05) + 1]
         
         # Modality agreement
         # High agreement when all trends point same direction
-        trend_agreement = 1.0 - np.std([
-            self.state.chemical_trend,
-            self.state.visual_trend,
-            self.state.environmental_trend
-        ])
+        # (1 - population std of the three trends)
+        mean_trend = (chemical_trend + visual_trend + environmental_trend) / 3.0
+        trend_agreement = 1.0 - math.sqrt((
+            (chemical_trend - mean_trend) ** 2 +
+            (visual_trend - mean_trend) ** 2 +
+            (environmental_trend - mean_trend) ** 2
+        ) / 3.0)
         
         return {
             'fused_score': fused_score,
             'trend': trend,
-            'confidence': self.state.temporal_confidence,
+            'confidence': state.temporal_confidence,
             'modality_agreement': max(0.0, min(1.0, trend_agreement)),
-            'chemical_trend': self.state.chemical_trend,
-            'visual_trend': self.state.visual_trend,
-            'persistence': max(self.state.chemical_persistence, 
-                              self.state.visual_persistence),
-            'cross_modal_lag': self.state.cross_modal_lag,
+            'chemical_trend': chemical_trend,
+            'visual_trend': visual_trend,
+            'persistence': max(state.chemical_persistence, 
+                              state.visual_persistence),
+            'cross_modal_lag': state.cross_modal_lag,
             'temporal_features': {
                 'base_score': base_score,
                 'trend_boost': trend_boost,
@@ -463,6 +853,9 @@ class MambaSSM:
         """Reset temporal state (e.g., after alert cleared)"""
         self.state = TemporalState()
         self.history_buffer.clear()
+        self._reset_moments()
+        self._chem_spikes.clear()
+        self._vis_spikes.clear()
         self.update_count = 0
     
     def get_statistics(self) -> Dict:
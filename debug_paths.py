@@ -12,13 +12,17 @@ def check_paths():
     
     if os.path.exists(target_dir):
         print("✅ Target dir exists.")
-        files = os.listdir(target_dir)
-        print(f"Files found: {files}")
+        # One directory scan; DirEntry carries the file type, so the
+        # lookup below needs no extra stat call
+        with os.scandir(target_dir) as it:
+            entries = {entry.name: entry for entry in it}
+        print(f"Files found: {list(entries)}")
         
         test_file = "Fire-scaled.jpg"
         full_path = os.path.join(target_dir, test_file)
         print(f"Testing access to: {full_path}")
-        if os.path.exists(full_path):
+        entry = entries.get(test_file)
+        if entry is not None and entry.is_file():
             print("✅ File exists!")
         else:
             print("❌ File NOT found at expected path.")
@@ -9,6 +9,190 @@ This guide provides step-by-step instructions for integrating:
 4. Power management
 """
 
+import array
+import asyncio
+import fcntl
+import json
+import os
+import select
+import struct
+import termios
+import threading
+import time
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Hardware libraries are only present on the node itself
+try:
+    import serial
+    SERIAL_AVAILABLE = True
+except ImportError:
+    SERIAL_AVAILABLE = False
+
+try:
+    import lgpio
+    LGPIO_AVAILABLE = True
+except ImportError:
+    LGPIO_AVAILABLE = False
+
+
+def _numpy_scalar_to_builtin(obj):
+    """json.dumps default= hook for NumPy scalars (np.float32, np.bool_, ...)"""
+    if hasattr(obj, 'item'):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(obj) -> bytes:
+    """Compact UTF-8 JSON for radio payloads (orjson when installed)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, separators=(',', ':'),
+                      default=_numpy_scalar_to_builtin).encode()
+
+
+ASYNC_LOW_LATENCY = 0x2000
+_SERIAL_FLAGS_OFFSET = 16  # serial_struct: int type, line; uint port; int irq, flags
+
+
+def _set_low_latency(ser):
+    """
+    Ask the UART driver to push received bytes up immediately and make
+    reads return as soon as one byte is available (VMIN=1, VTIME=0).
+
+    Drivers without TIOCGSERIAL support (pty, some USB bridges) are left
+    untouched.
+    """
+    fd = ser.fileno()
+
+    try:
+        info = bytearray(128)  # >= sizeof(struct serial_struct)
+        fcntl.ioctl(fd, termios.TIOCGSERIAL, info, True)
+        flags, = struct.unpack_from('i', info, _SERIAL_FLAGS_OFFSET)
+        struct.pack_into('i', info, _SERIAL_FLAGS_OFFSET, flags | ASYNC_LOW_LATENCY)
+        fcntl.ioctl(fd, termios.TIOCSSERIAL, info)
+    except OSError:
+        pass
+
+    attrs = termios.tcgetattr(fd)
+    attrs[6][termios.VMIN] = 1
+    attrs[6][termios.VTIME] = 0
+    termios.tcsetattr(fd, termios.TCSANOW, attrs)
+
+
+# RockBLOCK AT commands and response prefixes
+_CMD_AT = b'AT\r'
+_CMD_SBDD0 = b'AT+SBDD0\r'
+_CMD_SBDWT = b'AT+SBDWT='
+_CMD_SBDIX = b'AT+SBDIX\r'
+_CMD_CSQF = b'AT+CSQF\r'
+_SBDIX_PREFIX = b'+SBDIX:'
+_CSQF_PREFIX = b'+CSQF:'
+
+
+# Receive buffers for modem responses, allocated once and reused per call
+_SBDIX_BUF = bytearray(512)
+_CSQF_BUF = bytearray(512)
+_RESULT_BUF = bytearray(512)
+
+
+def _wait_for_line(ser, marker: bytes, timeout: float, buf: bytearray) -> bytes:
+    """
+    Block until a CRLF-terminated line containing ``marker`` arrives.
+
+    Sleeps in select() on the tty fd so the process wakes only when the
+    modem actually sends bytes, rather than spinning on readline() timeouts.
+    Bytes are read from the fd straight into ``buf`` with os.readv (pyserial's
+    readinto reads into a fresh bytes object and copies), so the wait loop
+    does not allocate.
+
+    Returns:
+        The matching line (without CRLF), or b'' on timeout
+    """
+    view = memoryview(buf)
+    size = len(buf)
+    fd = ser.fileno()
+    find = buf.find
+    monotonic = time.monotonic
+    deadline = monotonic() + timeout
+    n = 0
+
+    while True:
+        idx = find(marker, 0, n)
+        if idx >= 0:
+            end = find(b'\r\n', idx, n)
+            if end >= 0:
+                return bytes(view[idx:end])
+
+        remaining = deadline - monotonic()
+        if remaining <= 0:
+            return b''
+
+        ready, _, _ = select.select([fd], [], [], remaining)
+        if not ready:
+            continue
+
+        if n == size:
+            # Buffer full: keep only what could still be part of a match
+            if idx > 0:
+                keep = n - idx
+            elif idx == 0:
+                keep = 0  # oversized line, drop it
+            else:
+                keep = len(marker) - 1
+            view[:keep] = view[n - keep:n]
+            n = keep
+
+        want = min(max(ser.in_waiting, 1), size - n)
+        n += os.readv(fd, [view[n:n + want]])
+
+
+def _await_ok(ser, timeout: float = 1.0) -> bool:
+    """
+    Wait for the final result code of an AT command.
+
+    Returns as soon as the modem answers instead of sleeping a fixed time.
+
+    Returns:
+        True on OK, False on ERROR or timeout
+    """
+    buf = _RESULT_BUF
+    view = memoryview(buf)
+    size = len(buf)
+    fd = ser.fileno()
+    find = buf.find
+    monotonic = time.monotonic
+    deadline = monotonic() + timeout
+    n = 0
+
+    while True:
+        # Result codes start on a fresh line, which keeps the command echo
+        # (e.g. a payload containing "OK") from matching
+        if find(b'\nOK\r\n', 0, n) >= 0:
+            return True
+        if find(b'\nERROR', 0, n) >= 0:
+            return False
+
+        remaining = deadline - monotonic()
+        if remaining <= 0:
+            return False
+
+        ready, _, _ = select.select([fd], [], [], remaining)
+        if not ready:
+            continue
+
+        if n == size:
+            view[:5] = view[n - 5:n]
+            n = 5
+
+        want = min(max(ser.in_waiting, 1), size - n)
+        n += os.readv(fd, [view[n:n + want]])
+
+
 # ============================================================================
 #  LORA MESH NETWORK INTEGRATION
 # ============================================================================
@@ -78,18 +262,16 @@ def transmit_lora_alert(rfm9x, alert_data: dict) -> bool:
     Returns:
         True if transmission successful
     """
-    import json
-    
     try:
-        # Serialize to JSON (max 252 bytes)
-        message = json.dumps(alert_data)
+        # Serialize straight to bytes (max 252 bytes)
+        message = _dumps(alert_data)
         
         if len(message) > 252:
             # Truncate if too long
             message = message[:252]
         
         # Send message
-        rfm9x.send(bytes(message, 'utf-8'))
+        rfm9x.send(message)
         
         print(f"📡 LoRa TX: {len(message)} bytes")
         return True
@@ -110,8 +292,6 @@ def receive_lora_messages(rfm9x, timeout: float = 5.0):
     Returns:
         Received message or None
     """
-    import json
-    
     packet = rfm9x.receive(timeout=timeout)
     
     if packet:
@@ -163,8 +343,8 @@ def setup_rockblock():
     Returns:
         Serial connection to RockBLOCK
     """
-    import serial
-    import time
+    if not SERIAL_AVAILABLE:
+        raise ImportError("pyserial is required: pip install pyserial")
     
     # Open serial connection
     ser = serial.Serial(
@@ -172,15 +352,15 @@ def setup_rockblock():
         baudrate=19200,
         timeout=1
     )
+    _set_low_latency(ser)
     
     # Wait for modem to initialize
     time.sleep(2)
     
     # Test AT command
-    ser.write(b'AT\r')
-    response = ser.readline()
+    ser.write(_CMD_AT)
     
-    if b'OK' in response:
+    if _await_ok(ser):
         print("✅ RockBLOCK initialized")
     else:
         print("❌ RockBLOCK initialization failed")
@@ -199,46 +379,43 @@ def transmit_satellite_alert(ser, alert_data: dict) -> bool:
     Returns:
         True if transmission successful
     """
-    import json
-    import time
-    
     try:
         # Serialize to JSON (max 340 bytes for SBD)
-        message = json.dumps(alert_data)
+        message = _dumps(alert_data)
         
         if len(message) > 340:
             # Truncate if too long
             message = message[:340]
         
         # Clear mobile-originated buffer
-        ser.write(b'AT+SBDD0\r')
-        time.sleep(1)
+        ser.write(_CMD_SBDD0)
+        if not _await_ok(ser):
+            print("❌ Satellite TX error: could not clear MO buffer")
+            return False
         
         # Write message to buffer
-        ser.write(f'AT+SBDWT={message}\r'.encode())
-        time.sleep(1)
+        ser.write(_CMD_SBDWT + message + b'\r')
+        if not _await_ok(ser):
+            print("❌ Satellite TX error: modem rejected message")
+            return False
         
         # Initiate SBD session (transmit)
         print("🛰️  Initiating satellite transmission...")
-        ser.write(b'AT+SBDIX\r')
+        ser.write(_CMD_SBDIX)
         
         # Wait for response (can take 30+ seconds)
-        start_time = time.time()
-        while time.time() - start_time < 60:  # 60 second timeout
-            response = ser.readline().decode()
-            
-            if '+SBDIX:' in response:
-                # Parse response
-                # Format: +SBDIX:<MO status>,<MOMSN>,<MT status>,<MTMSN>,<MT length>,<MTqueued>
-                parts = response.split(':')[1].split(',')
-                mo_status = int(parts[0])
-                
-                if mo_status <= 4:  # Success codes
-                    print(f"✅ Satellite TX successful (status: {mo_status})")
-                    return True
-                else:
-                    print(f"❌ Satellite TX failed (status: {mo_status})")
-                    return False
+        # Format: +SBDIX:<MO status>,<MOMSN>,<MT status>,<MTMSN>,<MT length>,<MTqueued>
+        response = _wait_for_line(ser, _SBDIX_PREFIX, 60, _SBDIX_BUF)
+
+        if response:
+            mo_status = int(response[len(_SBDIX_PREFIX):response.find(b',')])
+
+            if mo_status <= 4:  # Success codes
+                print(f"✅ Satellite TX successful (status: {mo_status})")
+                return True
+            else:
+                print(f"❌ Satellite TX failed (status: {mo_status})")
+                return False
         
         print("❌ Satellite TX timeout")
         return False
@@ -258,16 +435,13 @@ def get_satellite_signal_quality(ser) -> int:
     Returns:
         Signal quality (0-5)
     """
-    import time
-    
-    ser.write(b'AT+CSQF\r')
-    time.sleep(1)
+    ser.write(_CMD_CSQF)
     
-    response = ser.readline().decode()
+    response = _wait_for_line(ser, _CSQF_PREFIX, 2, _CSQF_BUF)
     
-    if '+CSQF:' in response:
+    if response:
         # Format: +CSQF:<quality>
-        quality = int(response.split(':')[1].strip())
+        quality = int(response[len(_CSQF_PREFIX):])
         print(f"🛰️  Signal quality: {quality}/5 bars")
         return quality
     
@@ -301,7 +475,8 @@ def setup_gps():
     Returns:
         GPS serial connection
     """
-    import serial
+    if not SERIAL_AVAILABLE:
+        raise ImportError("pyserial is required: pip install pyserial")
     
     # For UART GPS
     gps_serial = serial.Serial(
@@ -309,34 +484,106 @@ def setup_gps():
         baudrate=9600,
         timeout=1
     )
+    _set_low_latency(gps_serial)
     
     return gps_serial
 
 
+# Fixed receive buffer for the GPS UART; bytes [0, _nmea_tail) are the
+# start of a sentence that has not been terminated yet
+_nmea_buf = bytearray(512)
+_nmea_view = memoryview(_nmea_buf)
+_nmea_tail = 0
+
+
+def _parse_gga(sentence) -> tuple:
+    """
+    Parse a $GPGGA sentence (bytes, without line ending)
+    
+    Returns:
+        (latitude, longitude, altitude) in decimal degrees / metres,
+        or None if the checksum fails or there is no fix
+    """
+    body, star, checksum = bytes(sentence).rstrip().partition(b'*')
+    if star:
+        calc = 0
+        for c in body[1:]:
+            calc ^= c
+        if calc != int(checksum[:2], 16):
+            return None
+    
+    f = body.split(b',')
+    if len(f) < 10 or not f[2] or not f[4]:
+        return None
+    
+    # ddmm.mmmm / dddmm.mmmm
+    lat = int(f[2][:2]) + float(f[2][2:]) / 60.0
+    if f[3] == b'S':
+        lat = -lat
+    lon = int(f[4][:3]) + float(f[4][3:]) / 60.0
+    if f[5] == b'W':
+        lon = -lon
+    alt = float(f[9]) if f[9] else None
+    
+    return lat, lon, alt
+
+
 def get_gps_location(gps_serial) -> tuple:
     """
     Get current GPS coordinates
     
+    Drains everything queued on the UART through a fixed 512-byte buffer
+    and parses the most recent complete $GPGGA sentence, so a slow caller
+    never falls behind the receiver's output.
+    
     Args:
         gps_serial: GPS serial connection
     
     Returns:
         (latitude, longitude, altitude) or (None, None, None)
     """
-    import pynmea2
+    global _nmea_tail
     
     try:
-        line = gps_serial.readline().decode('ascii', errors='ignore')
+        fd = gps_serial.fileno()
+        navail = array.array('i', [0])
+        fcntl.ioctl(fd, termios.FIONREAD, navail, True)
+        pending = navail[0]
         
-        if line.startswith('$GPGGA'):
-            msg = pynmea2.parse(line)
+        buf, view, tail = _nmea_buf, _nmea_view, _nmea_tail
+        size = len(buf)
+        line = None
+        
+        while True:
+            if tail == size:
+                tail = 0  # no line ending in a full buffer, drop it
+            
+            if pending:
+                got = os.readv(fd, [view[tail:tail + min(pending, size - tail)]])
+                pending = pending - got if got else 0
+                tail += got
             
-            if msg.latitude and msg.longitude:
-                return (
-                    msg.latitude,
-                    msg.longitude,
-                    msg.altitude
-                )
+            end = buf.rfind(b'\n', 0, tail)
+            if end >= 0:
+                start = buf.rfind(b'$GPGGA', 0, end)
+                if start >= 0:
+                    line = bytes(view[start:buf.index(b'\n', start)])
+                
+                # Move the unterminated remainder to the front
+                rest = tail - end - 1
+                view[:rest] = view[end + 1:tail]
+                tail = rest
+            
+            if not pending:
+                break
+        
+        _nmea_tail = tail
+        
+        if line is not None:
+            fix = _parse_gga(line)
+            
+            if fix is not None and fix[0] and fix[1]:
+                return fix
         
     except Exception as e:
         print(f"GPS read error: {e}")
@@ -370,14 +617,21 @@ Battery Options:
 Recommended: Solar + 20Ah 12V SLA + charge controller
 """
 
+# gpiochip handle shared by the power-control functions
+_gpiochip = None
+
+
 def setup_power_management():
     """
     Configure power-saving features
     """
-    import RPi.GPIO as GPIO
+    global _gpiochip
     
-    # Setup GPIO for power control
-    GPIO.setmode(GPIO.BCM)
+    if not LGPIO_AVAILABLE:
+        raise ImportError("lgpio is required: pip install lgpio")
+    
+    # Claim pins through the GPIO character device (/dev/gpiochip0)
+    _gpiochip = lgpio.gpiochip_open(0)
     
     # Define power control pins
     LORA_POWER_PIN = 17
@@ -385,11 +639,11 @@ def setup_power_management():
     CAMERA_POWER_PIN = 22
     SATELLITE_POWER_PIN = 23
     
-    # Configure as outputs
-    GPIO.setup(LORA_POWER_PIN, GPIO.OUT)
-    GPIO.setup(GPS_POWER_PIN, GPIO.OUT)
-    GPIO.setup(CAMERA_POWER_PIN, GPIO.OUT)
-    GPIO.setup(SATELLITE_POWER_PIN, GPIO.OUT)
+    # Configure as outputs, initially off
+    lgpio.gpio_claim_output(_gpiochip, LORA_POWER_PIN, 0)
+    lgpio.gpio_claim_output(_gpiochip, GPS_POWER_PIN, 0)
+    lgpio.gpio_claim_output(_gpiochip, CAMERA_POWER_PIN, 0)
+    lgpio.gpio_claim_output(_gpiochip, SATELLITE_POWER_PIN, 0)
     
     return {
         'lora': LORA_POWER_PIN,
@@ -407,10 +661,11 @@ def enable_module(power_pins: dict, module: str):
         power_pins: Dictionary of power control pins
         module: Module name ('lora', 'gps', 'camera', 'satellite')
     """
-    import RPi.GPIO as GPIO
+    if not LGPIO_AVAILABLE:
+        raise ImportError("lgpio is required: pip install lgpio")
     
     if module in power_pins:
-        GPIO.output(power_pins[module], GPIO.HIGH)
+        lgpio.gpio_write(_gpiochip, power_pins[module], 1)
         print(f"⚡ {module.upper()} powered ON")
 
 
@@ -422,10 +677,11 @@ def disable_module(power_pins: dict, module: str):
         power_pins: Dictionary of power control pins
         module: Module name
     """
-    import RPi.GPIO as GPIO
+    if not LGPIO_AVAILABLE:
+        raise ImportError("lgpio is required: pip install lgpio")
     
     if module in power_pins:
-        GPIO.output(power_pins[module], GPIO.LOW)
+        lgpio.gpio_write(_gpiochip, power_pins[module], 0)
         print(f"💤 {module.upper()} powered OFF")
 
 
@@ -433,6 +689,65 @@ def disable_module(power_pins: dict, module: str):
 #  COMPLETE INTEGRATION EXAMPLE
 # ============================================================================
 
+# Longest wait for a first fix; a cold start with clear sky takes ~30s
+GPS_FIX_TIMEOUT = 300.0
+
+
+def _wait_for_gps_fix(timeout: float = GPS_FIX_TIMEOUT,
+                      stop: threading.Event = None) -> tuple:
+    """
+    Open the GPS and block until it reports a position
+    
+    Args:
+        timeout: Seconds to wait for a fix before giving up
+        stop: Set by the caller to abandon the wait early
+    
+    Raises:
+        TimeoutError: No fix within ``timeout`` seconds
+    """
+    gps = setup_gps()
+    stop = stop or threading.Event()
+    deadline = time.monotonic() + timeout
+    
+    lat, lon, alt = get_gps_location(gps)
+    while lat is None:
+        if time.monotonic() >= deadline:
+            raise TimeoutError(f"No GPS fix after {timeout:.0f}s")
+        print("Waiting for GPS fix...")
+        if stop.wait(2):
+            return None, None, None
+        lat, lon, alt = get_gps_location(gps)
+    
+    return lat, lon, alt
+
+
+def _setup_satellite() -> tuple:
+    """Open the RockBLOCK and read its signal quality"""
+    satellite = setup_rockblock()
+    return satellite, get_satellite_signal_quality(satellite)
+
+
+async def _bring_up_radios():
+    """
+    Initialize GPS, LoRa and satellite concurrently
+    
+    The first failure propagates; the GPS wait is then told to stop so
+    the worker thread does not keep asyncio.run() from returning.
+    
+    Returns:
+        ((lat, lon, alt), lora, (satellite, signal))
+    """
+    stop = threading.Event()
+    try:
+        return await asyncio.gather(
+            asyncio.to_thread(_wait_for_gps_fix, GPS_FIX_TIMEOUT, stop),
+            asyncio.to_thread(setup_lora_transceiver),
+            asyncio.to_thread(_setup_satellite),
+        )
+    finally:
+        stop.set()
+
+
 def deploy_complete_hardware_system():
     """
     Example of complete hardware integration
@@ -444,36 +759,18 @@ def deploy_complete_hardware_system():
         AlertPriority,
         NetworkChannel
     )
-    import time
     
     print("\n🚀 Deploying Complete Hardware System")
     print("="*70)
     
-    # 1. Initialize GPS
-    print("\n📍 Initializing GPS...")
-    gps = setup_gps()
-    
-    # Get initial location
-    lat, lon, alt = get_gps_location(gps)
-    while lat is None:
-        print("Waiting for GPS fix...")
-        time.sleep(2)
-        lat, lon, alt = get_gps_location(gps)
+    # 1-3. GPS, LoRa and RockBLOCK are independent devices, bring them up together
+    print("\n📍 Initializing GPS, 📡 LoRa and 🛰️  RockBLOCK...")
+    (lat, lon, alt), lora, (satellite, signal) = asyncio.run(_bring_up_radios())
     
     location = GPSCoordinate(latitude=lat, longitude=lon, altitude=alt)
     print(f"✅ GPS Location: {lat:.4f}, {lon:.4f}, {alt:.1f}m")
-    
-    # 2. Initialize LoRa
-    print("\n📡 Initializing LoRa...")
-    lora = setup_lora_transceiver()
     print("✅ LoRa ready")
     
-    # 3. Initialize Satellite
-    print("\n🛰️  Initializing RockBLOCK...")
-    satellite = setup_rockblock()
-    
-    # Check signal quality
-    signal = get_satellite_signal_quality(satellite)
     if signal >= 2:
         print(f"✅ Satellite ready (signal: {signal}/5)")
     else:
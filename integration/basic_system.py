@@ -4,7 +4,7 @@ Phase-1 Watchdog + Phase-0 Fusion (Unified)
 """
 
 import time
-import board
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 from phase1_watchdog_layer import Phase1WatchdogLayer, SensorReading
@@ -14,42 +14,62 @@ from phase0_fusion_engine import Phase0FusionEngine
 #  SENSOR INITIALIZATION
 # ============================================================================
 
-# ---- DHT22 ----
-try:
-    import adafruit_dht
-    dht_sensor = adafruit_dht.DHT22(board.D4)
-    HAS_DHT22 = True
-except:
-    HAS_DHT22 = False
-    print("⚠️ DHT22 not available")
-
-# ---- ADC (MQ Sensors) ----
-try:
-    import busio
-    import adafruit_ads1x15.ads1015 as ADS
-    from adafruit_ads1x15.analog_in import AnalogIn
-
-    i2c = busio.I2C(board.SCL, board.SDA)
-    ads = ADS.ADS1015(i2c)
-
-    smoke_sensor = AnalogIn(ads, ADS.P0)
-    co2_sensor = AnalogIn(ads, ADS.P1)
-
-    HAS_SMOKE = HAS_CO2 = True
-except:
-    HAS_SMOKE = HAS_CO2 = False
-    print("⚠️ MQ sensors not available")
-
-# ---- Flame Sensor ----
-try:
-    import RPi.GPIO as GPIO
-    FLAME_PIN = 22
-    GPIO.setmode(GPIO.BCM)
-    GPIO.setup(FLAME_PIN, GPIO.IN)
-    HAS_FLAME = True
-except:
-    HAS_FLAME = False
-    print("⚠️ Flame sensor not available")
+# Hardware libraries are slow to import on a Pi Zero, so sensors are set up
+# on the first read_all_sensors() call rather than at import time
+_initialized = False
+HAS_DHT22 = HAS_SMOKE = HAS_CO2 = HAS_FLAME = False
+
+# DHT22 is bit-banged and slow, so it is read on its own thread while the
+# ADC and GPIO reads run on the caller's thread
+_dht_executor = None
+
+
+def _init_sensors():
+    global _initialized, _dht_executor
+    global HAS_DHT22, HAS_SMOKE, HAS_CO2, HAS_FLAME
+    global dht_sensor, smoke_sensor, co2_sensor, lgpio, gpiochip, FLAME_PIN
+
+    _initialized = True
+
+    # ---- DHT22 ----
+    try:
+        import board
+        import adafruit_dht
+        dht_sensor = adafruit_dht.DHT22(board.D4)
+        HAS_DHT22 = True
+        _dht_executor = ThreadPoolExecutor(max_workers=1)
+    except:
+        HAS_DHT22 = False
+        print("⚠️ DHT22 not available")
+
+    # ---- ADC (MQ Sensors) ----
+    try:
+        import board
+        import busio
+        import adafruit_ads1x15.ads1015 as ADS
+        from adafruit_ads1x15.analog_in import AnalogIn
+
+        i2c = busio.I2C(board.SCL, board.SDA)
+        ads = ADS.ADS1015(i2c)
+
+        smoke_sensor = AnalogIn(ads, ADS.P0)
+        co2_sensor = AnalogIn(ads, ADS.P1)
+
+        HAS_SMOKE = HAS_CO2 = True
+    except:
+        HAS_SMOKE = HAS_CO2 = False
+        print("⚠️ MQ sensors not available")
+
+    # ---- Flame Sensor ----
+    try:
+        import lgpio
+        FLAME_PIN = 22
+        gpiochip = lgpio.gpiochip_open(0)
+        lgpio.gpio_claim_input(gpiochip, FLAME_PIN)
+        HAS_FLAME = True
+    except:
+        HAS_FLAME = False
+        print("⚠️ Flame sensor not available")
 
 
 # ============================================================================
@@ -76,20 +96,21 @@ fusion_engine = Phase0FusionEngine()
 #  SENSOR READ
 # ============================================================================
 
+def _read_dht22():
+    try:
+        return dht_sensor.temperature, dht_sensor.humidity
+    except:
+        return None
+
+
 def read_all_sensors():
+    if not _initialized:
+        _init_sensors()
+
     sensors = {}
     now = datetime.now()
 
-    if HAS_DHT22:
-        try:
-            sensors['TEMP_001'] = SensorReading(
-                'TEMP_001', dht_sensor.temperature, now, 'temperature'
-            )
-            sensors['HUM_001'] = SensorReading(
-                'HUM_001', dht_sensor.humidity, now, 'humidity'
-            )
-        except:
-            sensors['TEMP_001'] = sensors['HUM_001'] = None
+    dht_future = _dht_executor.submit(_read_dht22) if HAS_DHT22 else None
 
     if HAS_SMOKE:
         smoke_ppm = (smoke_sensor.voltage / 3.3) * 1000
@@ -104,11 +125,22 @@ def read_all_sensors():
         )
 
     if HAS_FLAME:
-        flame = float(GPIO.input(FLAME_PIN))
+        flame = float(lgpio.gpio_read(gpiochip, FLAME_PIN))
         sensors['FLAME_001'] = SensorReading(
             'FLAME_001', flame, now, 'flame'
         )
 
+    if dht_future is not None:
+        dht = dht_future.result()
+        if dht is None:
+            climate = {'TEMP_001': None, 'HUM_001': None}
+        else:
+            climate = {
+                'TEMP_001': SensorReading('TEMP_001', dht[0], now, 'temperature'),
+                'HUM_001': SensorReading('HUM_001', dht[1], now, 'humidity'),
+            }
+        sensors = {**climate, **sensors}
+
     return sensors
 
 
@@ -117,24 +149,7 @@ def read_all_sensors():
 # ============================================================================
 
 def validate_all_sensors(raw):
-    validated = {}
-    available = {}
-
-    for r in raw.values():
-        if r and r.value is not None:
-            available[r.sensor_type] = r.value
-
-    for sid, reading in raw.items():
-        result = watchdog.validate(
-            reading=reading,
-            sensor_id=sid,
-            sensor_type=reading.sensor_type if reading else None,
-            available_sensors=available
-        )
-        if result.is_valid:
-            validated[sid] = result
-
-    return validated
+    return watchdog.validate_batch(raw, impute_missing=True)
 
 
 # ============================================================================
@@ -172,7 +187,7 @@ def main():
     except KeyboardInterrupt:
         print("\n🛑 System shutdown")
         if HAS_FLAME:
-            GPIO.cleanup()
+            lgpio.gpiochip_close(gpiochip)
 
 
 # ============================================================================
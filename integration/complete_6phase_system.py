@@ -20,8 +20,12 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import time
+import queue
 import logging
+import logging.handlers
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Optional
 from dataclasses import dataclass
 
@@ -30,13 +34,13 @@ from phases.phase1_watchdog.watchdog_layer import Phase1WatchdogLayer, SensorRea
 from phases.phase0_fusion.fusion_engine import Phase0FusionEngine
 from phases.phase2_fractal.fractal_gate import Phase2FractalGate
 from phases.phase3_chaos.chaos_kernel import Phase3ChaosKernel
-from phases.phase4_vision.vision_mamba import Phase4VisionMamba
 from phases.phase5_logic.logic_gate import Phase5LogicGate, PhaseInputs
 from phases.phase6_communication.communication_layer import (
     Phase6CommunicationLayer,
     GPSCoordinate,
     create_alert_from_phase5
 )
+from core.scheduling import DeadlineScheduler
 
 # Real sensor interface
 try:
@@ -47,6 +51,24 @@ except ImportError:
     print("⚠️  Real sensor interface not found - using mock mode")
 
 
+# Sensor-id substrings that identify the sensors the integration layer
+# reads directly, checked in order
+_SENSOR_ROLE_TAGS = (
+    ('temperature', 'TEMP'),
+    ('camera', 'CAMERA'),
+)
+
+
+@lru_cache(maxsize=128)
+def _sensor_role(sensor_id: str) -> Optional[str]:
+    """Role of a sensor from its id, or None if it has none"""
+    sensor_id = sensor_id.upper()
+    for role, tag in _SENSOR_ROLE_TAGS:
+        if tag in sensor_id:
+            return role
+    return None
+
+
 # ============================================================================
 #  SYSTEM CONFIGURATION
 # ============================================================================
@@ -104,6 +126,16 @@ class Complete6PhaseFireDetectionSystem:
     - Phase-5 adjusts sampling rate based on risk
     """
     
+    # Mock readings drawn per RNG call when no sensor interface is present
+    MOCK_NOISE_POOL = 1024
+    
+    TIER_EMOJI = {
+        'green': '🟢',
+        'yellow': '🟡',
+        'orange': '🟠',
+        'red': '🔴'
+    }
+    
     def __init__(self, config: SystemConfig):
         """
         Initialize complete system
@@ -135,6 +167,22 @@ class Complete6PhaseFireDetectionSystem:
         self.iteration = 0
         self.current_sample_interval = config.sample_interval
         self.last_alert_time: Optional[datetime] = None
+        self.skipped_cycles = 0  # Calm cycles that bypassed Phase-3 analysis
+        
+        # Role -> sensor_id index, rebuilt only when the roster changes
+        self._sensor_roles: Dict[str, str] = {}
+        self._sensor_roster = frozenset()
+        
+        # Pre-drawn noise for mock readings (refilled when exhausted)
+        self._mock_noise = []
+        
+        # Per-cycle scratch, refilled by process_cycle
+        self._phase_inputs = PhaseInputs()
+        self._result = dict.fromkeys((
+            'iteration', 'timestamp', 'environmental_state',
+            'fractal_result', 'chaos_result', 'vision_confidence',
+            'decision', 'alert', 'next_sample_interval'
+        ))
         
         print("\n" + "="*70 + "\n")
     
@@ -170,12 +218,14 @@ class Complete6PhaseFireDetectionSystem:
             self.phase3 = None
             print("⚠️  Phase-3 Chaos Kernel: DISABLED")
         
-        # Phase-4: Vision Mamba
+        # Phase-4: Vision Mamba (imported on first use; pulls in OpenCV).
+        # Frames run on a single worker thread so OpenCV, which releases
+        # the GIL, overlaps Phase-3 on the cycle thread
+        self.phase4 = None
+        self._vision_executor = None
         if config.enable_phase4:
-            self.phase4 = Phase4VisionMamba()
-            print("✅ Phase-4 Vision Mamba: ACTIVE")
+            print("✅ Phase-4 Vision Mamba: ACTIVE (loads when vision activates)")
         else:
-            self.phase4 = None
             print("⚠️  Phase-4 Vision Mamba: DISABLED")
         
         # Phase-5: Logic Gate
@@ -200,7 +250,8 @@ class Complete6PhaseFireDetectionSystem:
         Execute one complete sensing and decision cycle
         
         Returns:
-            Dictionary with cycle results
+            Dictionary with cycle results. The same dict is reused and
+            overwritten by the next cycle; copy it to keep it.
         """
         self.iteration += 1
         timestamp = datetime.now()
@@ -212,7 +263,7 @@ class Complete6PhaseFireDetectionSystem:
             raw_sensors = self.sensor_interface.read_sensors()
         else:
             # Mock sensor data for testing
-            raw_sensors = self._generate_mock_sensors()
+            raw_sensors = self._generate_mock_sensors(timestamp)
         
         # =====================================================================
         # STEP 2: PHASE-1 VALIDATION
@@ -230,8 +281,10 @@ class Complete6PhaseFireDetectionSystem:
         # =====================================================================
         environmental_state = self.phase0.fuse(
             validated_sensors,
-            phase1_stats=phase1_stats
+            phase1_stats=phase1_stats,
+            timestamp=timestamp
         )
+        temporal_metadata = environmental_state.temporal_metadata
         
         # =====================================================================
         # STEP 4: PHASE-2 FRACTAL ANALYSIS
@@ -248,17 +301,42 @@ class Complete6PhaseFireDetectionSystem:
             hurst_exponent = 0.5
         
         # =====================================================================
-        # STEP 5: PHASE-3 CHAOS ANALYSIS
+        # STEP 5: PHASE-4 VISION SUBMIT (Power-Gated)
+        # =====================================================================
+        vision_future = None
+        
+        # Only activate vision if Phase-2 detects structure
+        if self.config.enable_phase4 and self.phase2 and self.phase2.should_activate_vision():
+            # Get camera data from validated sensors
+            camera_id = self._sensor_role_index(validated_sensors).get('camera')
+            camera_data = None
+            if camera_id is not None:
+                camera_data = getattr(validated_sensors[camera_id], 'value', None)
+            
+            if camera_data is not None:
+                if self.phase4 is None:
+                    from phases.phase4_vision.vision_mamba import Phase4VisionMamba
+                    self.phase4 = Phase4VisionMamba()
+                    self._vision_executor = ThreadPoolExecutor(max_workers=1)
+                vision_future = self._vision_executor.submit(
+                    self.phase4.process, camera_data, timestamp
+                )
+        
+        # =====================================================================
+        # STEP 6: PHASE-3 CHAOS ANALYSIS (overlaps Phase-4)
         # =====================================================================
         if self.phase3:
             # Get temporal trend from Phase-0 if available
-            temporal_trend = getattr(environmental_state, 'temporal_metadata', {}).get('chemical_trend', 0.0)
+            temporal_trend = temporal_metadata.get('chemical_trend', 0.0)
+            risk_score = environmental_state.fire_risk_score
             
-            chaos_result = self.phase3.update(
-                environmental_state.fire_risk_score,
-                temporal_trend,
-                timestamp
-            )
+            # Calm cycles (no structure, near-zero risk and trend, stable
+            # streak) only record the sample
+            if has_structure or self.phase3.quick_gate(risk_score, temporal_trend):
+                chaos_result = self.phase3.update(risk_score, temporal_trend, timestamp)
+            else:
+                chaos_result = self.phase3.monitor_stub(risk_score, temporal_trend, timestamp)
+                self.skipped_cycles += 1
             is_unstable = chaos_result.is_unstable
             lyapunov_exponent = chaos_result.lyapunov_exponent
         else:
@@ -266,51 +344,42 @@ class Complete6PhaseFireDetectionSystem:
             lyapunov_exponent = 0.0
         
         # =====================================================================
-        # STEP 6: PHASE-4 VISION PROCESSING (Power-Gated)
+        # STEP 7: PHASE-4 VISION RESULT
         # =====================================================================
         vision_confidence = 0.0
         smoke_confidence = 0.0
         
-        # Only activate vision if Phase-2 detects structure
-        if self.phase4 and self.phase2 and self.phase2.should_activate_vision():
-            # Get camera data from validated sensors
-            camera_data = None
-            for sensor_id, sensor in validated_sensors.items():
-                if 'CAMERA' in sensor_id.upper():
-                    camera_data = getattr(sensor, 'value', None)
-                    break
-            
-            if camera_data is not None:
-                vision_result = self.phase4.process_frame(camera_data, timestamp)
-                vision_confidence = vision_result.get('confidence', 0.0)
-                smoke_confidence = vision_result.get('smoke_confidence', 0.0)
+        if vision_future is not None:
+            vision_result = vision_future.result()
+            vision_confidence = vision_result.confidence
+            if vision_result.smoke_analysis is not None:
+                smoke_confidence = vision_result.smoke_analysis.smoke_confidence
         
         # =====================================================================
-        # STEP 7: PHASE-5 DECISION LOGIC
+        # STEP 8: PHASE-5 DECISION LOGIC
         # =====================================================================
         
-        # Consolidate inputs for Phase-5
-        phase_inputs = PhaseInputs(
-            fire_risk_score=environmental_state.fire_risk_score,
-            cross_modal_agreement=environmental_state.cross_modal_agreement,
-            temporal_trend=getattr(environmental_state, 'temporal_metadata', {}).get('trend', 'stable'),
-            persistence=getattr(environmental_state, 'temporal_metadata', {}).get('persistence', 0.0),
-            has_structure=has_structure,
-            hurst_exponent=hurst_exponent,
-            is_unstable=is_unstable,
-            lyapunov_exponent=lyapunov_exponent,
-            vision_confidence=vision_confidence,
-            camera_healthy=vision_confidence > 0,
-            smoke_confidence=smoke_confidence,
-            trauma_level=phase1_stats.get('trauma_level', 0.0),
-            timestamp=timestamp
-        )
+        # Consolidate inputs for Phase-5 (refilled in place every cycle)
+        phase_inputs = self._phase_inputs
+        phase_inputs.fire_risk_score = environmental_state.fire_risk_score
+        phase_inputs.cross_modal_agreement = environmental_state.cross_modal_agreement
+        phase_inputs.temporal_trend = temporal_metadata.get('trend', 'stable')
+        phase_inputs.persistence = temporal_metadata.get('persistence', 0.0)
+        phase_inputs.has_structure = has_structure
+        phase_inputs.hurst_exponent = hurst_exponent
+        phase_inputs.is_unstable = is_unstable
+        phase_inputs.lyapunov_exponent = lyapunov_exponent
+        phase_inputs.vision_confidence = vision_confidence
+        phase_inputs.camera_healthy = vision_confidence > 0
+        phase_inputs.smoke_confidence = smoke_confidence
+        phase_inputs.trauma_level = phase1_stats.get('trauma_level', 0.0)
+        phase_inputs.timestamp = timestamp
         
         # Make decision
         decision = self.phase5.decide(phase_inputs, neighbor_nodes=[])
         
         # =====================================================================
-        # STEP 8: PHASE-6 COMMUNICATION
+        # STEP 9: PHASE-6 COMMUNICATION
         # =====================================================================
         alert = None
         if self.phase6:
@@ -336,24 +405,25 @@ class Complete6PhaseFireDetectionSystem:
                 self.last_alert_time = timestamp
         
         # =====================================================================
-        # STEP 9: ADJUST SAMPLING RATE
+        # STEP 10: ADJUST SAMPLING RATE
         # =====================================================================
         self.current_sample_interval = decision.next_sample_interval
         
         # =====================================================================
         # RETURN CYCLE RESULTS
         # =====================================================================
-        return {
-            'iteration': self.iteration,
-            'timestamp': timestamp,
-            'environmental_state': environmental_state,
-            'fractal_result': fractal_result if self.phase2 else None,
-            'chaos_result': chaos_result if self.phase3 else None,
-            'vision_confidence': vision_confidence,
-            'decision': decision,
-            'alert': alert,
-            'next_sample_interval': self.current_sample_interval
-        }
+        result = self._result
+        result['iteration'] = self.iteration
+        result['timestamp'] = timestamp
+        result['environmental_state'] = environmental_state
+        result['fractal_result'] = fractal_result if self.phase2 else None
+        result['chaos_result'] = chaos_result if self.phase3 else None
+        result['vision_confidence'] = vision_confidence
+        result['decision'] = decision
+        result['alert'] = alert
+        result['next_sample_interval'] = self.current_sample_interval
+        
+        return result
     
     def _validate_sensors(self, raw_sensors: Dict) -> Dict:
         """
@@ -370,7 +440,7 @@ class Complete6PhaseFireDetectionSystem:
         # Get available sensor values for cross-validation
         available = {
             k: v.value for k, v in raw_sensors.items()
-            if v is not None and hasattr(v, 'value')
+            if v is not None
         }
         
         for sensor_id, reading in raw_sensors.items():
@@ -380,7 +450,7 @@ class Complete6PhaseFireDetectionSystem:
             result = self.phase1.validate(
                 reading=reading,
                 sensor_id=sensor_id,
-                sensor_type=getattr(reading, 'sensor_type', 'unknown'),
+                sensor_type=reading.sensor_type or 'unknown',
                 available_sensors=available
             )
             
@@ -399,12 +469,33 @@ class Complete6PhaseFireDetectionSystem:
         Returns:
             Temperature in Celsius
         """
-        for sensor_id, sensor in validated_sensors.items():
-            if 'TEMP' in sensor_id.upper():
-                return getattr(sensor, 'value', 25.0)
+        temp_id = self._sensor_role_index(validated_sensors).get('temperature')
+        if temp_id is not None:
+            return getattr(validated_sensors[temp_id], 'value', 25.0)
         
         return 25.0  # Default
     
+    def _sensor_role_index(self, validated_sensors: Dict) -> Dict[str, str]:
+        """
+        Map each role to the first sensor_id that fills it
+        
+        Args:
+            validated_sensors: Validated sensor data
+        
+        Returns:
+            Dictionary of role -> sensor_id
+        """
+        if validated_sensors.keys() != self._sensor_roster:
+            roles = {}
+            for sensor_id in validated_sensors:
+                role = _sensor_role(sensor_id)
+                if role is not None:
+                    roles.setdefault(role, sensor_id)
+            self._sensor_roles = roles
+            self._sensor_roster = frozenset(validated_sensors)
+        
+        return self._sensor_roles
+    
     def _get_battery_level(self) -> float:
         """
         Get battery level
@@ -415,33 +506,42 @@ class Complete6PhaseFireDetectionSystem:
         # TODO: Read from actual battery monitor
         return 80.0  # Mock value
     
-    def _generate_mock_sensors(self) -> Dict:
+    def _generate_mock_sensors(self, timestamp: Optional[datetime] = None) -> Dict:
         """
         Generate mock sensor data for testing
         
+        Args:
+            timestamp: Cycle timestamp to stamp the readings with (default: now)
+        
         Returns:
             Dictionary of mock sensor readings
         """
-        import numpy as np
+        if not self._mock_noise:
+            import numpy as np
+            # One RNG call per pool instead of three per cycle; popped from
+            # the end, so the pool is reversed to keep draw order
+            self._mock_noise = np.random.randn(self.MOCK_NOISE_POOL, 3).tolist()[::-1]
         
-        timestamp = datetime.now()
+        temp_noise, hum_noise, voc_noise = self._mock_noise.pop()
+        if timestamp is None:
+            timestamp = datetime.now()
         
         return {
             'TEMP_001': SensorReading(
                 sensor_id='TEMP_001',
-                value=25.0 + np.random.randn() * 2.0,
+                value=25.0 + temp_noise * 2.0,
                 timestamp=timestamp,
                 sensor_type='temperature'
             ),
             'HUM_001': SensorReading(
                 sensor_id='HUM_001',
-                value=50.0 + np.random.randn() * 10.0,
+                value=50.0 + hum_noise * 10.0,
                 timestamp=timestamp,
                 sensor_type='humidity'
             ),
             'VOC_001': SensorReading(
                 sensor_id='VOC_001',
-                value=100.0 + np.random.randn() * 20.0,
+                value=100.0 + voc_noise * 20.0,
                 timestamp=timestamp,
                 sensor_type='voc'
             )
@@ -456,60 +556,76 @@ class Complete6PhaseFireDetectionSystem:
         """
         decision = results['decision']
         env_state = results['environmental_state']
-        
-        print(f"\n{'─'*70}")
-        print(f"🔄 CYCLE {results['iteration']} - {results['timestamp'].strftime('%H:%M:%S')}")
-        print(f"{'─'*70}")
-        
-        # Environmental state
-        print(f"\n🌲 ENVIRONMENTAL STATE:")
-        print(f"  Fire Risk: {env_state.fire_risk_score:.0%}")
-        print(f"  Agreement: {env_state.cross_modal_agreement:.0%}")
-        print(f"  Confidence: {env_state.overall_confidence:.0%}")
+        fractal = results['fractal_result']
+        chaos = results['chaos_result']
+        
+        # Build the report and write it once; each print() is a separate
+        # write to a line-buffered stdout
+        lines = [
+            f"\n{'─'*70}",
+            f"🔄 CYCLE {results['iteration']} - {results['timestamp'].strftime('%H:%M:%S')}",
+            f"{'─'*70}",
+            
+            # Environmental state
+            f"\n🌲 ENVIRONMENTAL STATE:",
+            f"  Fire Risk: {env_state.fire_risk_score:.0%}",
+            f"  Agreement: {env_state.cross_modal_agreement:.0%}",
+            f"  Confidence: {env_state.overall_confidence:.0%}",
+        ]
         
         # Phase results
-        if results['fractal_result']:
-            print(f"\n🔬 FRACTAL ANALYSIS:")
-            print(f"  Hurst: {results['fractal_result'].hurst_exponent:.3f}")
-            print(f"  Structure: {'✅ YES' if results['fractal_result'].has_structure else '❌ NO'}")
-        
-        if results['chaos_result']:
-            print(f"\n⚡ CHAOS ANALYSIS:")
-            print(f"  Lyapunov: {results['chaos_result'].lyapunov_exponent:.3f}")
-            print(f"  Unstable: {'✅ YES' if results['chaos_result'].is_unstable else '❌ NO'}")
+        if fractal:
+            lines += [
+                f"\n🔬 FRACTAL ANALYSIS:",
+                f"  Hurst: {fractal.hurst_exponent:.3f}",
+                f"  Structure: {'✅ YES' if fractal.has_structure else '❌ NO'}",
+            ]
+        
+        if chaos:
+            lines += [
+                f"\n⚡ CHAOS ANALYSIS:",
+                f"  Lyapunov: {chaos.lyapunov_exponent:.3f}",
+                f"  Unstable: {'✅ YES' if chaos.is_unstable else '❌ NO'}",
+            ]
         
         if results['vision_confidence'] > 0:
-            print(f"\n👁️  VISION:")
-            print(f"  Confidence: {results['vision_confidence']:.0%}")
+            lines += [
+                f"\n👁️  VISION:",
+                f"  Confidence: {results['vision_confidence']:.0%}",
+            ]
         
         # Decision
-        tier_emoji = {
-            'green': '🟢',
-            'yellow': '🟡',
-            'orange': '🟠',
-            'red': '🔴'
-        }
+        tier = decision.risk_tier.value
         
-        print(f"\n🎯 DECISION:")
-        print(f"  {tier_emoji.get(decision.risk_tier.value, '⚪')} {decision.risk_tier.value.upper()}")
-        print(f"  State: {decision.system_state.value.upper()}")
-        print(f"  Alert: {'🚨 YES' if decision.should_alert else '✅ NO'}")
+        lines += [
+            f"\n🎯 DECISION:",
+            f"  {self.TIER_EMOJI.get(tier, '⚪')} {tier.upper()}",
+            f"  State: {decision.system_state.value.upper()}",
+            f"  Alert: {'🚨 YES' if decision.should_alert else '✅ NO'}",
+        ]
         
         # Alert sent
-        if results['alert']:
-            alert = results['alert']
-            print(f"\n📡 ALERT SENT:")
-            print(f"  Priority: P{alert.priority.value}")
-            print(f"  Channel: {alert.channel.value}")
-            print(f"  ID: {alert.alert_id}")
+        alert = results['alert']
+        if alert:
+            lines += [
+                f"\n📡 ALERT SENT:",
+                f"  Priority: P{alert.priority.value}",
+                f"  Channel: {alert.channel.value}",
+                f"  ID: {alert.alert_id}",
+            ]
         
         # Next action
-        print(f"\n⏰ Next sample in: {results['next_sample_interval']}s")
+        lines.append(f"\n⏰ Next sample in: {results['next_sample_interval']}s")
+        
+        print("\n".join(lines))
     
     def run_continuous_monitoring(self, print_status: bool = True):
         """
         Run continuous monitoring loop
         
+        Cycles are scheduled against monotonic deadlines, so the period is
+        Phase-5's sample interval rather than interval + compute time.
+        
         Args:
             print_status: Whether to print status each cycle
         """
@@ -518,6 +634,8 @@ class Complete6PhaseFireDetectionSystem:
         print("="*70)
         print("Press Ctrl+C to stop\n")
         
+        scheduler = DeadlineScheduler(self.logger)
+        
         try:
             while True:
                 # Execute cycle
@@ -527,8 +645,8 @@ class Complete6PhaseFireDetectionSystem:
                 if print_status:
                     self.print_cycle_status(results)
                 
-                # Wait for next cycle
-                time.sleep(self.current_sample_interval)
+                # Wait for next cycle, measured from this cycle's deadline
+                time.sleep(scheduler.delay(self.current_sample_interval))
                 
         except KeyboardInterrupt:
             print("\n\n⏸️  Monitoring stopped by user")
@@ -561,6 +679,10 @@ class Complete6PhaseFireDetectionSystem:
             stats = self.phase3.get_statistics()
             print(f"  Analyses: {stats['analyses_performed']}")
             print(f"  Instability detected: {stats['instability_detected']}")
+            print(f"  Calm cycles skipped: {self.skipped_cycles}")
+        
+        if self._vision_executor:
+            self._vision_executor.shutdown(wait=True)
         
         if self.phase5:
             print(f"\nPhase-5:")
@@ -590,15 +712,28 @@ def deploy_production_system(node_id: str = "NODE_001",
         latitude: GPS latitude
         longitude: GPS longitude
     """
-    # Set up logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(f'fire_detection_{node_id}.log'),
-            logging.StreamHandler()
-        ]
+    # Set up logging. Records go through a queue to a listener thread, so
+    # file and console writes never stall a monitoring cycle
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    file_handler = logging.handlers.RotatingFileHandler(
+        f'fire_detection_{node_id}.log',
+        maxBytes=10_000_000,
+        backupCount=5
     )
+    stream_handler = logging.StreamHandler()
+    for handler in (file_handler, stream_handler):
+        handler.setFormatter(formatter)
+    
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, file_handler, stream_handler)
+    
+    # The cycle thread only renders the message text; timestamps and the
+    # full format are applied by the listener. force=True because
+    # importing Phase-1 has already configured the root logger.
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler], force=True)
+    listener.start()
     
     # Create configuration
     config = SystemConfig(
@@ -616,7 +751,11 @@ def deploy_production_system(node_id: str = "NODE_001",
     system = Complete6PhaseFireDetectionSystem(config)
     
     # Run continuous monitoring
-    system.run_continuous_monitoring(print_status=True)
+    try:
+        system.run_continuous_monitoring(print_status=True)
+    finally:
+        # Flush queued records
+        listener.stop()
 
 
 if __name__ == "__main__":
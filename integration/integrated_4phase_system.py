@@ -21,6 +21,7 @@ from phase0_fusion_with_mamba_clean import Phase0FusionEngineWithMamba
 from phase2_fractal_gate import Phase2FractalGate, print_fractal_analysis
 from phase3_chaos_kernel import Phase3ChaosKernel, print_chaos_analysis
 from environmental_state import EnvironmentalState
+from scheduling import DeadlineScheduler
 
 
 class IntegratedFireDetectionSystem:
@@ -108,24 +109,7 @@ class IntegratedFireDetectionSystem:
         # PHASE-1: VALIDATE SENSORS
         # =====================================================================
         if self.enable_phase1:
-            validated_sensors = {}
-            for sensor_id, reading in raw_sensors.items():
-                if reading is None:
-                    continue
-                
-                result = self.phase1_watchdog.validate(
-                    reading=reading,
-                    sensor_id=sensor_id,
-                    sensor_type=reading.sensor_type if hasattr(reading, 'sensor_type') else None,
-                    available_sensors={
-                        k: v.value for k, v in raw_sensors.items()
-                        if v is not None and hasattr(v, 'value')
-                    }
-                )
-                
-                if result.is_valid:
-                    validated_sensors[sensor_id] = result
-            
+            validated_sensors = self.phase1_watchdog.validate_batch(raw_sensors)
             phase1_stats = self.phase1_watchdog.get_statistics()
         else:
             # No Phase-1: pass through
@@ -141,7 +125,7 @@ class IntegratedFireDetectionSystem:
         )
         
         # Extract temporal metadata
-        temporal_metadata = getattr(phase0_state, 'temporal_metadata', {})
+        temporal_metadata = phase0_state.temporal_metadata
         risk_score = phase0_state.fire_risk_score
         
         # Get temporal trend for Phase-3
@@ -341,7 +325,7 @@ class IntegratedFireDetectionSystem:
         for reason in alert['reasoning']:
             print(f"  • {reason}")
         
-        self.logger.critical(f"FIRE ALERT: {alert['alert_level']} (confidence={alert['confidence']:.0%})")
+        self.logger.critical("FIRE ALERT: %s (confidence=%.0f%%)", alert['alert_level'], alert['confidence'] * 100)
         
         # TODO: Implement actual alert mechanisms
         # self._send_alert_to_rangers(alert)
@@ -371,7 +355,7 @@ class IntegratedFireDetectionSystem:
         print(f"  Agreement: {phase0.cross_modal_agreement:.0%}")
         print(f"  Confidence: {phase0.overall_confidence:.0%}")
         
-        if hasattr(phase0, 'temporal_metadata'):
+        if phase0.temporal_metadata:
             tm = phase0.temporal_metadata
             print(f"  Trend: {tm['trend']}")
             print(f"  Persistence: {tm['persistence']:.0%}")
@@ -408,6 +392,9 @@ class IntegratedFireDetectionSystem:
             sensor_reader: Object with read_sensors() method
             check_interval: Seconds between sensor readings
             print_status: Whether to print status each iteration
+        
+        Iterations are scheduled against monotonic deadlines, so the period
+        is check_interval rather than check_interval + compute time.
         """
         print("\n" + "="*70)
         print("🔄 CONTINUOUS MONITORING MODE")
@@ -416,6 +403,7 @@ class IntegratedFireDetectionSystem:
         print("Press Ctrl+C to stop\n")
         
         iteration = 0
+        scheduler = DeadlineScheduler(self.logger, "iterations")
         
         try:
             while True:
@@ -435,8 +423,9 @@ class IntegratedFireDetectionSystem:
                 if system_state['should_alert']:
                     self.trigger_alert(system_state)
                 
-                # Wait before next check
-                time.sleep(check_interval)
+                # Wait before next check, measured from this iteration's
+                # deadline
+                time.sleep(scheduler.delay(check_interval))
                 
         except KeyboardInterrupt:
             print("\n\n⏸️  Monitoring stopped by user")
@@ -21,6 +21,7 @@ except ImportError:
 # Phase-0 imports
 from phase0_fusion_engine import Phase0FusionEngine
 from environmental_state import EnvironmentalState
+from scheduling import DeadlineScheduler
 
 # REAL sensor interface (replaces MockSensorSimulator)
 from real_sensor_interface import RealSensorInterface
@@ -172,7 +173,8 @@ class ProductionFireDetectionSystem:
         print("🛰️  Transmitting via satellite...")
         
         # Log alert
-        self.logger.critical(f"FIRE ALERT: Risk={state.fire_risk_score:.0%}, Confidence={state.overall_confidence:.0%}")
+        self.logger.critical("FIRE ALERT: Risk=%.0f%%, Confidence=%.0f%%",
+                             state.fire_risk_score * 100, state.overall_confidence * 100)
         
         # TODO: Implement actual alert mechanisms:
         self._send_lora_alert(alert)
@@ -268,6 +270,9 @@ class ProductionFireDetectionSystem:
         Args:
             check_interval: Seconds between sensor readings
             print_status: Whether to print status each iteration
+        
+        Iterations are scheduled against monotonic deadlines, so the period
+        is check_interval rather than check_interval + compute time.
         """
         print("\n" + "="*70)
         print("🔄 CONTINUOUS MONITORING MODE")
@@ -276,6 +281,7 @@ class ProductionFireDetectionSystem:
         print("Press Ctrl+C to stop\n")
         
         iteration = 0
+        scheduler = DeadlineScheduler(self.logger, "iterations")
         
         try:
             while True:
@@ -292,8 +298,9 @@ class ProductionFireDetectionSystem:
                 if state.should_alert():
                     self.trigger_alert(state)
                 
-                # Wait before next check
-                time.sleep(check_interval)
+                # Wait before next check, measured from this iteration's
+                # deadline
+                time.sleep(scheduler.delay(check_interval))
                 
         except KeyboardInterrupt:
             print("\n\n⏸️  Monitoring stopped by user")
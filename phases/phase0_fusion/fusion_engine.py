@@ -110,7 +110,8 @@ class Phase0FusionEngine:
     def fuse(
         self, 
         validated_sensors: Dict,
-        phase1_stats: Optional[Dict] = None
+        phase1_stats: Optional[Dict] = None,
+        timestamp: Optional[datetime] = None
     ) -> EnvironmentalState:
         """
         Main fusion pipeline - converts validated sensors to environmental state
@@ -119,6 +120,7 @@ class Phase0FusionEngine:
             validated_sensors: Dict of Phase-1 validated sensor readings
                 Format: {sensor_id: ValidationResult}
             phase1_stats: Optional Phase-1 statistics (trauma level, etc.)
+            timestamp: Sample time of the readings (default: now)
         
         Returns:
             EnvironmentalState with complete fire risk assessment
@@ -207,7 +209,7 @@ class Phase0FusionEngine:
         processing_time = (time.time() - start_time) * 1000  # milliseconds
         
         state = EnvironmentalState(
-            timestamp=datetime.now(),
+            timestamp=timestamp or datetime.now(),
             chemical_state=chemical_state,
             visual_state=visual_state,
             environmental_context=environmental_context,
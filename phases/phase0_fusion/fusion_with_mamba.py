@@ -14,7 +14,7 @@ Integration:
 
 import numpy as np
 from datetime import datetime
-from typing import Dict
+from typing import Dict, Optional
 import time
 
 from core.environmental_state import EnvironmentalState
@@ -59,6 +59,7 @@ class Phase0FusionEngineWithMamba:
             try:
                 print("🚀 Attempting to load Hugging Face Mamba-130m...")
                 self.mamba_ssm = MambaSSM_HF()
+                self.mamba_ssm.warmup()  # pay torch.compile here, not on the first cycle
                 self.backend_type = "HuggingFace"
                 print("✅ HF Mamba-130m Active (Neural Adapter Loaded)")
             except Exception as e:
@@ -74,19 +75,22 @@ class Phase0FusionEngineWithMamba:
     
     def fuse(self, 
              validated_sensors: Dict,
-             phase1_stats: Dict = None) -> EnvironmentalState:
+             phase1_stats: Dict = None,
+             timestamp: Optional[datetime] = None) -> EnvironmentalState:
         """
         Fuse validated sensor data with temporal reasoning
         
         Args:
             validated_sensors: Dict of validated sensor readings from Phase-1
             phase1_stats: Statistics from Phase-1 watchdog
+            timestamp: Sample time of the readings (default: now)
         
         Returns:
             EnvironmentalState with temporal analysis
         """
         start_time = time.time()
-        timestamp = datetime.now()
+        if timestamp is None:
+            timestamp = datetime.now()
         
         # =====================================================================
         # STEP 1: Compute modality scores (same as original Phase-0)
@@ -40,13 +40,13 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SensorReading:
     """Individual sensor reading with metadata"""
     sensor_id: str
     value: float
     timestamp: datetime
-    sensor_type: str  # 'temperature', 'humidity', 'co2', 'smoke', etc.
+    sensor_type: Optional[str] = None  # 'temperature', 'humidity', 'co2', 'smoke', etc.
     
     
 @dataclass
@@ -111,7 +111,8 @@ class TraumaSystem:
         # Increase trauma level (max 1.0)
         self.trauma_level = min(1.0, self.trauma_level + severity * 0.3)
         
-        logger.warning(f"⚡ TRAUMA REGISTERED: {description} | Severity: {severity:.2f} | Level now: {self.trauma_level:.2f}")
+        logger.warning("⚡ TRAUMA REGISTERED: %s | Severity: %.2f | Level now: %.2f",
+                       description, severity, self.trauma_level)
         
     def apply_decay(self):
         """
@@ -128,7 +129,7 @@ class TraumaSystem:
             self.last_decay = now
             
             if old_level > 0 and self.trauma_level < old_level:
-                logger.info(f"🌱 TRAUMA DECAY: {old_level:.2f} → {self.trauma_level:.2f}")
+                logger.info("🌱 TRAUMA DECAY: %.2f → %.2f", old_level, self.trauma_level)
                 
     def get_adaptive_threshold(self, base_threshold: float) -> float:
         """
@@ -188,7 +189,7 @@ class VirtualSensorImputation:
                 imputed = np.mean(recent_values)
                 confidence = 0.7  # Reasonable confidence from history
                 
-                logger.info(f"📊 IMPUTATION (Temporal): {sensor_id} = {imputed:.2f} (conf: {confidence:.2f})")
+                logger.info("📊 IMPUTATION (Temporal): %s = %.2f (conf: %.2f)", sensor_id, imputed, confidence)
                 return imputed, confidence
         
         # Method 2: Spatial correlation (use related sensors)
@@ -199,7 +200,7 @@ class VirtualSensorImputation:
             imputed = 100 - humidity * 0.8  # Crude but illustrative
             confidence = 0.6
             
-            logger.info(f"📊 IMPUTATION (Correlation): {sensor_id} = {imputed:.2f} (conf: {confidence:.2f})")
+            logger.info("📊 IMPUTATION (Correlation): %s = %.2f (conf: %.2f)", sensor_id, imputed, confidence)
             return imputed, confidence
             
         # Method 3: Physics-based default (domain knowledge)
@@ -214,11 +215,11 @@ class VirtualSensorImputation:
             imputed = defaults[sensor_type]
             confidence = 0.5  # Low confidence, but better than nothing
             
-            logger.info(f"📊 IMPUTATION (Default): {sensor_id} = {imputed:.2f} (conf: {confidence:.2f})")
+            logger.info("📊 IMPUTATION (Default): %s = %.2f (conf: %.2f)", sensor_id, imputed, confidence)
             return imputed, confidence
         
         # Fallback: Cannot impute
-        logger.warning(f"⚠️  IMPUTATION FAILED: {sensor_id} - No basis for reconstruction")
+        logger.warning("⚠️  IMPUTATION FAILED: %s - No basis for reconstruction", sensor_id)
         return 0.0, 0.0
 
 
@@ -253,6 +254,12 @@ class Phase1WatchdogLayer:
         """
         self.config = config or self._default_config()
         
+        # Range table compiled once: sensor_type -> (min, max, dying_gasp)
+        self._ranges: Dict[str, Tuple[float, float, Optional[float]]] = {
+            sensor_type: (r['min'], r['max'], r.get('dying_gasp'))
+            for sensor_type, r in self.config['sensor_ranges'].items()
+        }
+        
         # State tracking
         self.sensor_states: Dict[str, SensorState] = {}
         self.trauma_system = TraumaSystem(decay_days=7)
@@ -269,8 +276,8 @@ class Phase1WatchdogLayer:
         }
         
         logger.info("🔥 PHASE-1 WATCHDOG LAYER INITIALIZED")
-        logger.info(f"   Trauma decay: {self.trauma_system.decay_days} days")
-        logger.info(f"   Sensor types: {list(self.config['sensor_ranges'].keys())}")
+        logger.info("   Trauma decay: %s days", self.trauma_system.decay_days)
+        logger.info("   Sensor types: %s", list(self.config['sensor_ranges'].keys()))
         
     def _default_config(self) -> Dict:
         """Default configuration for industrial fire detection"""
@@ -301,26 +308,25 @@ class Phase1WatchdogLayer:
         Returns:
             (is_valid, failure_reason)
         """
-        sensor_type = reading.sensor_type
+        ranges = self._ranges.get(reading.sensor_type)
         
-        if sensor_type not in self.config['sensor_ranges']:
-            logger.warning(f"⚠️  Unknown sensor type: {sensor_type}")
+        if ranges is None:
+            logger.warning("⚠️  Unknown sensor type: %s", reading.sensor_type)
             return True, None  # Don't reject unknown types
             
-        ranges = self.config['sensor_ranges'][sensor_type]
+        lo, hi, dying_gasp = ranges
         value = reading.value
         
         # Check dying gasp threshold FIRST (critical alert)
-        if ranges.get('dying_gasp') is not None:
-            if value >= ranges['dying_gasp']:
-                self._trigger_dying_gasp(reading)
-                return False, f"DYING GASP: {value:.1f} >= {ranges['dying_gasp']}"
+        if dying_gasp is not None and value >= dying_gasp:
+            self._trigger_dying_gasp(reading)
+            return False, f"DYING GASP: {value:.1f} >= {dying_gasp}"
         
         # Check physical bounds
-        if value < ranges['min'] or value > ranges['max']:
+        if value < lo or value > hi:
             self.stats['range_failures'] += 1
-            reason = f"Out of range: {value:.1f} not in [{ranges['min']}, {ranges['max']}]"
-            logger.error(f"❌ RANGE FAILURE: {reading.sensor_id} - {reason}")
+            reason = f"Out of range: {value:.1f} not in [{lo}, {hi}]"
+            logger.error("❌ RANGE FAILURE: %s - %s", reading.sensor_id, reason)
             return False, reason
             
         return True, None
@@ -341,10 +347,10 @@ class Phase1WatchdogLayer:
         
         logger.critical("=" * 70)
         logger.critical("💀 DYING GASP ACTIVATED")
-        logger.critical(f"   Sensor: {reading.sensor_id}")
-        logger.critical(f"   Type: {reading.sensor_type}")
-        logger.critical(f"   Value: {reading.value:.1f}")
-        logger.critical(f"   Time: {reading.timestamp}")
+        logger.critical("   Sensor: %s", reading.sensor_id)
+        logger.critical("   Type: %s", reading.sensor_type)
+        logger.critical("   Value: %.1f", reading.value)
+        logger.critical("   Time: %s", reading.timestamp)
         logger.critical("=" * 70)
         logger.critical("🛰️  EMERGENCY SATELLITE DUMP INITIATED")
         logger.critical("📦 BLACK BOX: Last 30 seconds of data")
@@ -395,7 +401,7 @@ class Phase1WatchdogLayer:
                 black_box['values'].append(float(val))
                 black_box['timestamps'].append(ts.isoformat())
                 
-        logger.info(f"📦 Black box captured {len(black_box['values'])} readings")
+        logger.info("📦 Black box captured %d readings", len(black_box['values']))
         return black_box
     
     # ═══════════════════════════════════════════════════════════════════
@@ -442,8 +448,8 @@ class Phase1WatchdogLayer:
                     state.is_broken = True
                     
                     reason = f"Frozen for {frozen_hours:.1f} hours at value {reading.value}"
-                    logger.error(f"❌ FROZEN FAILURE: {sensor_id} - {reason}")
-                    logger.warning(f"🔧 Priority-3 Alert: Maintenance Required via LoRaWAN")
+                    logger.error("❌ FROZEN FAILURE: %s - %s", sensor_id, reason)
+                    logger.warning("🔧 Priority-3 Alert: Maintenance Required via LoRaWAN")
                     
                     # Register moderate trauma
                     self.trauma_system.register_trauma(
@@ -502,7 +508,7 @@ class Phase1WatchdogLayer:
             validation_result.metadata['trauma_level'] = self.trauma_system.trauma_level
             validation_result.metadata['paranoid_mode'] = True
             
-            logger.debug(f"⚡ PARANOID MODE: Confidence reduced by {confidence_penalty:.2%}")
+            logger.debug("⚡ PARANOID MODE: Confidence reduced by %.2f%%", confidence_penalty * 100)
         else:
             validation_result.metadata['paranoid_mode'] = False
             
@@ -606,7 +612,7 @@ class Phase1WatchdogLayer:
         
         else:
             self.stats['null_failures'] += 1
-            logger.warning(f"⚠️  NULL SIGNAL: {sensor_id} - Attempting imputation")
+            logger.warning("⚠️  NULL SIGNAL: %s - Attempting imputation", sensor_id)
             
             # Attempt self-healing reconstruction
             imputed_value, confidence = self.imputation_engine.impute_missing_value(
@@ -638,7 +644,8 @@ class Phase1WatchdogLayer:
                     }
                 )
                 
-                logger.info(f"✅ IMPUTATION SUCCESS: {sensor_id} = {imputed_value:.2f} (reliability: {result.reliability_score:.2f})")
+                logger.info("✅ IMPUTATION SUCCESS: %s = %.2f (reliability: %.2f)",
+                            sensor_id, imputed_value, result.reliability_score)
                 
                 # CHECK-4: Apply trauma context
                 result = self._apply_trauma_context(result)
@@ -646,7 +653,7 @@ class Phase1WatchdogLayer:
                 return result
             else:
                 # Cannot impute — HARD FAILURE
-                logger.error(f"❌ NULL FAILURE: {sensor_id} - Cannot reconstruct")
+                logger.error("❌ NULL FAILURE: %s - Cannot reconstruct", sensor_id)
                 
                 return ValidationResult(
                     is_valid=False,
@@ -661,6 +668,53 @@ class Phase1WatchdogLayer:
                     }
                 )
     
+    def validate_batch(
+        self,
+        readings: Dict[str, Optional[SensorReading]],
+        impute_missing: bool = False
+    ) -> Dict[str, ValidationResult]:
+        """
+        Validate one cycle's worth of readings.
+        
+        The peer-value map is only needed to impute a missing signal (no
+        reading, or a reading with value None), so it is built at most once
+        per batch and only when one is missing; a cycle where every sensor
+        reported a value never builds it.
+        
+        Args:
+            readings: sensor_id -> reading (None for a missing signal)
+            impute_missing: Run missing readings through imputation instead
+                of skipping them
+            
+        Returns:
+            sensor_id -> ValidationResult for the readings that passed
+        """
+        available = None
+        
+        validate = self.validate
+        check_null = self._check_null
+        validated = {}
+        for sensor_id, reading in readings.items():
+            if not check_null(reading):
+                if reading is None and not impute_missing:
+                    continue
+                if available is None:
+                    available = {
+                        r.sensor_type: r.value for r in readings.values()
+                        if r is not None and r.value is not None
+                    }
+            
+            result = validate(
+                reading,
+                sensor_id,
+                reading.sensor_type if reading is not None else None,
+                available
+            )
+            if result.is_valid:
+                validated[sensor_id] = result
+        
+        return validated
+    
     def _update_sensor_state(self, reading: SensorReading):
         """Update sensor state history for temporal tracking"""
         sensor_id = reading.sensor_id
@@ -25,7 +25,48 @@ import numpy as np
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from collections import deque
+
+from core.jit import njit
+from core.ring_buffer import RingBuffer
+
+
+@njit(cache=True)
+def _rs_window(x: np.ndarray):
+    """
+    Single-window R/S Hurst estimate, H = log(R/S) / log(n), plus the
+    window mean and population variance from the same pass.
+    
+    Returns:
+        (hurst, mean, variance); hurst is NaN when the range or
+        deviation is zero
+    """
+    n = x.shape[0]
+    
+    mean = 0.0
+    for i in range(n):
+        mean += x[i]
+    mean /= n
+    
+    # Range of the cumulative mean-adjusted sum, and sample variance
+    cumsum = 0.0
+    cmin = np.inf
+    cmax = -np.inf
+    ss = 0.0
+    for i in range(n):
+        d = x[i] - mean
+        cumsum += d
+        if cumsum < cmin:
+            cmin = cumsum
+        if cumsum > cmax:
+            cmax = cumsum
+        ss += d * d
+    
+    R = cmax - cmin
+    S = np.sqrt(ss / (n - 1))
+    if S == 0.0 or R == 0.0:
+        return np.nan, mean, ss / n
+    
+    return np.log(R / S) / np.log(n), mean, ss / n
 
 
 @dataclass
@@ -98,7 +139,7 @@ class Phase2FractalGate:
         self.max_window_size = max_window_size
         
         # Time series buffer (stores Phase-0 risk scores)
-        self.risk_score_history = deque(maxlen=max_window_size)
+        self.risk_score_history = RingBuffer(max_window_size)
         
         # Statistics
         self.analysis_count = 0
@@ -108,6 +149,9 @@ class Phase2FractalGate:
         # Trauma tracking (NEW)
         self.current_trauma_level = 0.0
         self.threshold_adjustments = 0
+        
+        # Compile (or load) the R/S kernel now rather than on the first full window
+        _rs_window(np.arange(4, dtype=np.float64))
     
     def update(self, 
                risk_score: float, 
@@ -128,10 +172,7 @@ class Phase2FractalGate:
         self.current_trauma_level = trauma_level
         
         # Add to history buffer
-        self.risk_score_history.append({
-            'risk_score': risk_score,
-            'timestamp': timestamp
-        })
+        self.risk_score_history.append(risk_score)
         
         # Need minimum samples for reliable analysis
         if len(self.risk_score_history) < self.min_window_size:
@@ -150,16 +191,18 @@ class Phase2FractalGate:
             )
         
         # Extract time series
-        time_series = np.array([h['risk_score'] for h in self.risk_score_history])
+        time_series = self.risk_score_history.view()
+        n = len(time_series)
         
-        # Compute Hurst exponent
-        hurst, confidence = self._compute_hurst_exponent(time_series)
+        # Hurst exponent and window moments in one pass
+        raw_hurst, mean_value, variance = _rs_window(time_series)
+        hurst, confidence = self._finish_hurst(raw_hurst, n)
         
         # Compute persistence (normalized H value)
         persistence = self._compute_persistence(hurst)
         
         # Quality score (based on sample size and variance)
-        quality = self._compute_quality_score(time_series)
+        quality = self._quality_from_moments(n, mean_value, variance)
         
         # ✅ CRITICAL FIX: Compute trauma-adaptive threshold
         adaptive_threshold = self._compute_adaptive_threshold(trauma_level)
@@ -246,30 +289,15 @@ class Phase2FractalGate:
         if n < self.min_window_size:
             return 0.5, 0.0
         
-        # Remove mean (detrend)
-        mean_adjusted = time_series - np.mean(time_series)
-        
-        # Cumulative sum
-        cumsum = np.cumsum(mean_adjusted)
-        
-        # Range
-        R = np.max(cumsum) - np.min(cumsum)
-        
-        # Standard deviation
-        S = np.std(time_series, ddof=1)
-        
-        # Avoid division by zero
-        if S == 0 or R == 0:
+        hurst, _, _ = _rs_window(np.asarray(time_series, dtype=np.float64))
+        return self._finish_hurst(hurst, n)
+    
+    def _finish_hurst(self, hurst: float, n: int) -> Tuple[float, float]:
+        """Confidence and clamping for a raw R/S estimate over n samples"""
+        # Avoid division by zero (flat signal)
+        if np.isnan(hurst):
             return 0.5, 0.0
         
-        # R/S ratio
-        RS = R / S
-        
-        # Hurst exponent from R/S scaling
-        # E[R/S] ∝ n^H
-        # H = log(R/S) / log(n)
-        hurst = np.log(RS) / np.log(n)
-        
         # Confidence based on sample size and stability
         confidence = min(1.0, n / 60.0)  # More samples = higher confidence
         
@@ -309,17 +337,22 @@ class Phase2FractalGate:
         Returns:
             Quality score (0.0-1.0)
         """
-        n = len(time_series)
-        
+        return self._quality_from_moments(
+            len(time_series), np.mean(time_series), np.var(time_series)
+        )
+    
+    def _quality_from_moments(self,
+                              n: int,
+                              mean_value: float,
+                              variance: float) -> float:
+        """Quality score from window size, mean and population variance"""
         # Sample size quality
         size_quality = min(1.0, n / 60.0)
         
         # Variance quality (has signal)
-        variance = np.var(time_series)
         variance_quality = min(1.0, variance / 0.1)  # Normalize by expected variance
         
         # Saturation check (not all 0s or 1s)
-        mean_value = np.mean(time_series)
         saturation_quality = 1.0 - abs(mean_value - 0.5) / 0.5
         
         # Combined quality
@@ -25,7 +25,156 @@ import numpy as np
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from collections import deque
+
+from core.jit import njit
+from core.ring_buffer import RingBuffer
+
+
+@njit(cache=True)
+def _lyapunov_est(x: np.ndarray, dimension: int):
+    """
+    Mean 5-step log divergence over the delay-1 embedding of ``x``.
+    
+    Works on the series directly (row i of the embedding is
+    x[i], x[i+1], ..., x[i+dimension-1]) so no embedding matrix is built.
+    
+    Returns:
+        (lyapunov, confidence), lyapunov clamped to [-2, 2];
+        (0.0, 0.0) when nothing diverged
+    """
+    m = x.shape[0] - (dimension - 1)
+    divergences = np.empty(max(m, 0))
+    count = 0
+    
+    for i in range(m - 1):
+        d0 = 0.0
+        for k in range(dimension):
+            diff = x[i + 1 + k] - x[i + k]
+            d0 += diff * diff
+        
+        if d0 > 0.0 and i + 5 < m:
+            d_future = 0.0
+            for k in range(dimension):
+                diff = x[i + 5 + k] - x[i + k]
+                d_future += diff * diff
+            
+            if d_future > 0.0:
+                # Logarithmic divergence rate
+                divergences[count] = np.log(np.sqrt(d_future) / np.sqrt(d0)) / 5.0
+                count += 1
+    
+    if count == 0:
+        return 0.0, 0.0
+    
+    lyapunov = 0.0
+    for j in range(count):
+        lyapunov += divergences[j]
+    lyapunov /= count
+    
+    # Confidence based on sample size and stability of estimate
+    confidence = min(1.0, count / 30.0)
+    if count > 5:
+        var = 0.0
+        for j in range(count):
+            diff = divergences[j] - lyapunov
+            var += diff * diff
+        confidence *= 1.0 / (1.0 + np.sqrt(var / count))
+    
+    # Clamp to reasonable range
+    lyapunov = max(-2.0, min(2.0, lyapunov))
+    
+    return lyapunov, confidence
+
+
+@njit(cache=True)
+def _positive_feedback(risk: np.ndarray, trend: np.ndarray) -> float:
+    """
+    Positive-feedback score (0.0-1.0) over a window of at least 10 samples.
+    
+    0.4 * risk/trend correlation over the last 10 samples
+    + 0.3 * mean second difference over the last 5 (n >= 20)
+    + 0.3 * quadratic coefficient of the last 10 (n >= 15)
+    """
+    n = risk.shape[0]
+    m = 10
+    off = n - m
+    
+    # 1. Correlation between recent risk and trend (positive part only)
+    mr = 0.0
+    mt = 0.0
+    for i in range(off, n):
+        mr += risk[i]
+        mt += trend[i]
+    mr /= m
+    mt /= m
+    sxy = 0.0
+    sxx = 0.0
+    syy = 0.0
+    for i in range(off, n):
+        dr = risk[i] - mr
+        dt = trend[i] - mt
+        sxy += dr * dt
+        sxx += dr * dr
+        syy += dt * dt
+    correlation = 0.0
+    if sxx > 0.0 and syy > 0.0:
+        correlation = max(0.0, min(1.0, sxy / np.sqrt(sxx * syy)))
+    
+    # 2. Acceleration: mean of the last 5 second differences
+    acceleration_score = 0.0
+    if n >= 20:
+        acc = 0.0
+        for j in range(n - 7, n - 2):
+            acc += (risk[j + 2] - risk[j + 1]) - (risk[j + 1] - risk[j])
+        acceleration_score = max(0.0, min(1.0, acc / 5.0 * 10.0))
+    
+    # 3. Convexity: leading coefficient of a least-squares quadratic over
+    # x = 0..m-1, projected on the centred orthogonal quadratic
+    curvature_score = 0.0
+    if n >= 15:
+        xm = (m - 1) / 2.0
+        c = (m * m - 1) / 12.0
+        num = 0.0
+        den = 0.0
+        for i in range(m):
+            p2 = (i - xm) * (i - xm) - c
+            num += p2 * risk[off + i]
+            den += p2 * p2
+        curvature_score = max(0.0, min(1.0, num / den * 100.0))
+    
+    return 0.4 * correlation + 0.3 * acceleration_score + 0.3 * curvature_score
+
+
+@njit(cache=True)
+def _divergence_rate(risk: np.ndarray) -> float:
+    """Relative rise of the last 10 samples over the early baseline (n >= 10)"""
+    n = risk.shape[0]
+    
+    k = min(10, n // 3)
+    baseline = 0.0
+    for i in range(k):
+        baseline += risk[i]
+    baseline /= k
+    
+    current = 0.0
+    for i in range(n - 10, n):
+        current += risk[i]
+    current /= 10
+    
+    return max(0.0, (current - baseline) / (baseline + 0.01))
+
+
+@njit(cache=True)
+def _chaos_window(risk: np.ndarray, trend: np.ndarray, dimension: int):
+    """
+    All per-window Phase-3 statistics in one native call.
+    
+    Returns:
+        (lyapunov, confidence, positive_feedback, divergence)
+    """
+    lyapunov, confidence = _lyapunov_est(risk, dimension)
+    return (lyapunov, confidence,
+            _positive_feedback(risk, trend), _divergence_rate(risk))
 
 
 @dataclass
@@ -78,7 +227,10 @@ class Phase3ChaosKernel:
                  lyapunov_threshold: float = 0.0,
                  min_window_size: int = 40,
                  max_window_size: int = 120,
-                 embedding_dimension: int = 3):
+                 embedding_dimension: int = 3,
+                 calm_risk_threshold: float = 0.1,
+                 calm_trend_threshold: float = 0.01,
+                 calm_streak: int = 5):
         """
         Initialize Chaos Kernel
         
@@ -87,19 +239,34 @@ class Phase3ChaosKernel:
             min_window_size: Minimum samples needed for analysis
             max_window_size: Maximum samples to retain in buffer
             embedding_dimension: Dimension for phase space reconstruction
+            calm_risk_threshold: Risk score below which a cycle counts as calm
+            calm_trend_threshold: |trend| below which a cycle counts as calm
+            calm_streak: Consecutive stable analyses required before quick_gate
+                         lets full analysis be skipped
         """
         self.lyapunov_threshold = lyapunov_threshold
         self.min_window_size = min_window_size
         self.max_window_size = max_window_size
         self.embedding_dimension = embedding_dimension
+        self.calm_risk_threshold = calm_risk_threshold
+        self.calm_trend_threshold = calm_trend_threshold
+        self.calm_streak = calm_streak
         
-        # Time series buffer (stores Phase-0 risk scores and trends)
-        self.risk_score_history = deque(maxlen=max_window_size)
+        # Time series buffers (Phase-0 risk scores and trends, in step)
+        self.risk_score_history = RingBuffer(max_window_size)
+        self.trend_history = RingBuffer(max_window_size)
         
         # Statistics
         self.analysis_count = 0
         self.instability_detected_count = 0
         self.last_analysis: Optional[ChaosAnalysisResult] = None
+        
+        # Consecutive full analyses with λ below threshold (read by quick_gate)
+        self._stable_streak = 0
+        
+        # Compile (or load) the window kernels now rather than on the first full window
+        warm = np.linspace(0.0, 1.0, 20)
+        _chaos_window(warm, warm, embedding_dimension)
     
     def update(self, 
                risk_score: float, 
@@ -117,11 +284,8 @@ class Phase3ChaosKernel:
             ChaosAnalysisResult with instability detection decision
         """
         # Add to history buffer
-        self.risk_score_history.append({
-            'risk_score': risk_score,
-            'temporal_trend': temporal_trend,
-            'timestamp': timestamp
-        })
+        self.risk_score_history.append(risk_score)
+        self.trend_history.append(temporal_trend)
         
         # Need minimum samples for reliable analysis
         if len(self.risk_score_history) < self.min_window_size:
@@ -138,17 +302,14 @@ class Phase3ChaosKernel:
             )
         
         # Extract time series
-        risk_series = np.array([h['risk_score'] for h in self.risk_score_history])
-        trend_series = np.array([h['temporal_trend'] for h in self.risk_score_history])
-        
-        # Compute Lyapunov exponent
-        lyapunov, confidence = self._compute_lyapunov_exponent(risk_series)
+        risk_series = self.risk_score_history.view()
+        trend_series = self.trend_history.view()
         
-        # Detect positive feedback loops
-        positive_feedback = self._detect_positive_feedback(risk_series, trend_series)
-        
-        # Compute divergence rate
-        divergence = self._compute_divergence_rate(risk_series)
+        # Lyapunov exponent, positive feedback loops and divergence rate,
+        # computed together in one pass over the window
+        lyapunov, confidence, positive_feedback, divergence = _chaos_window(
+            risk_series, trend_series, self.embedding_dimension
+        )
         
         # Suspicion level (combines multiple indicators)
         suspicion = self._compute_suspicion_level(
@@ -180,10 +341,71 @@ class Phase3ChaosKernel:
         if is_unstable:
             self.instability_detected_count += 1
         
+        if is_unstable or lyapunov >= self.lyapunov_threshold:
+            self._stable_streak = 0
+        else:
+            self._stable_streak += 1
+        
         self.last_analysis = result
         
         return result
     
+    def quick_gate(self, risk_score: float, temporal_trend: float) -> bool:
+        """
+        Cheap O(1) precheck: does this cycle need full chaos analysis?
+        
+        Returns False only when the risk score and trend are both near zero
+        and the last ``calm_streak`` full analyses all came out stable, i.e.
+        when a fresh Lyapunov estimate cannot plausibly flip to unstable.
+        
+        Args:
+            risk_score: Fire risk score from Phase-0 fusion (0.0-1.0)
+            temporal_trend: Trend from Mamba SSM (rising/falling)
+        
+        Returns:
+            True if update() should run, False if monitor_stub() suffices
+        """
+        return not (
+            risk_score < self.calm_risk_threshold and
+            abs(temporal_trend) < self.calm_trend_threshold and
+            self._stable_streak >= self.calm_streak
+        )
+    
+    def monitor_stub(self,
+                     risk_score: float,
+                     temporal_trend: float,
+                     timestamp: datetime) -> ChaosAnalysisResult:
+        """
+        Record a calm sample without running the Lyapunov analysis
+        
+        The sample still goes into the history buffer so the next full
+        update() sees a continuous series. The result carries the last
+        full analysis forward and is never unstable.
+        
+        Args:
+            risk_score: Fire risk score from Phase-0 fusion (0.0-1.0)
+            temporal_trend: Trend from Mamba SSM (rising/falling)
+            timestamp: Current timestamp
+        
+        Returns:
+            ChaosAnalysisResult in monitoring state
+        """
+        self.risk_score_history.append(risk_score)
+        self.trend_history.append(temporal_trend)
+        
+        last = self.last_analysis
+        return ChaosAnalysisResult(
+            lyapunov_exponent=last.lyapunov_exponent if last else 0.0,
+            is_unstable=False,
+            positive_feedback=last.positive_feedback if last else 0.0,
+            suspicion_level=last.suspicion_level if last else 0.0,
+            confidence=last.confidence if last else 0.0,
+            timestamp=timestamp,
+            window_size=len(self.risk_score_history),
+            samples_analyzed=0,
+            divergence_rate=last.divergence_rate if last else 0.0
+        )
+    
     def _compute_lyapunov_exponent(self, 
                                    time_series: np.ndarray) -> Tuple[float, float]:
         """
@@ -205,53 +427,10 @@ class Phase3ChaosKernel:
         if n < self.min_window_size:
             return 0.0, 0.0
         
-        # Phase space reconstruction using time-delay embedding
-        embedded = self._time_delay_embedding(time_series, self.embedding_dimension)
-        
-        if embedded.shape[0] < 2:
-            return 0.0, 0.0
-        
-        # Compute average logarithmic divergence
-        divergences = []
-        
-        for i in range(len(embedded) - 1):
-            # Current point
-            x0 = embedded[i]
-            
-            # Next point
-            x1 = embedded[i + 1]
-            
-            # Distance between points
-            d0 = np.linalg.norm(x1 - x0)
-            
-            if d0 > 0:
-                # Look ahead a few steps
-                if i + 5 < len(embedded):
-                    x_future = embedded[i + 5]
-                    d_future = np.linalg.norm(x_future - x0)
-                    
-                    if d_future > 0:
-                        # Logarithmic divergence rate
-                        divergence = np.log(d_future / d0) / 5.0
-                        divergences.append(divergence)
-        
-        if len(divergences) == 0:
-            return 0.0, 0.0
-        
-        # Lyapunov exponent is average divergence rate
-        lyapunov = np.mean(divergences)
-        
-        # Confidence based on sample size and stability of estimate
-        confidence = min(1.0, len(divergences) / 30.0)
-        if len(divergences) > 5:
-            std_divergence = np.std(divergences)
-            stability = 1.0 / (1.0 + std_divergence)
-            confidence *= stability
-        
-        # Clamp to reasonable range
-        lyapunov = max(-2.0, min(2.0, lyapunov))
-        
-        return lyapunov, confidence
+        # Phase space reconstruction (time-delay embedding) + divergence
+        return _lyapunov_est(
+            np.asarray(time_series, dtype=np.float64), self.embedding_dimension
+        )
     
     def _time_delay_embedding(self, 
                               time_series: np.ndarray, 
@@ -308,46 +487,10 @@ class Phase3ChaosKernel:
         if len(risk_series) < 10:
             return 0.0
         
-        # 1. Check for correlation between risk and trend
-        # When risk is high, trend should be positive (rising)
-        recent_risk = risk_series[-10:]
-        recent_trend = trend_series[-10:]
-        
-        correlation = np.corrcoef(recent_risk, recent_trend)[0, 1]
-        correlation = max(0.0, correlation)  # Only positive correlation matters
-        
-        # 2. Check for acceleration (second derivative > 0)
-        # Risk score should be accelerating, not just increasing
-        if len(risk_series) >= 20:
-            # First derivative (velocity)
-            velocity = np.diff(risk_series)
-            
-            # Second derivative (acceleration)
-            acceleration = np.diff(velocity)
-            
-            # Average recent acceleration
-            recent_acceleration = np.mean(acceleration[-5:]) if len(acceleration) >= 5 else 0.0
-            
-            # Normalize to [0, 1]
-            acceleration_score = max(0.0, min(1.0, recent_acceleration * 10.0))
-        else:
-            acceleration_score = 0.0
-        
-        # 3. Check for convexity (upward curvature)
-        if len(risk_series) >= 15:
-            # Fit quadratic to recent data
-            x = np.arange(len(recent_risk))
-            coeffs = np.polyfit(x, recent_risk, 2)
-            
-            # Positive second-order coefficient = upward curvature
-            curvature_score = max(0.0, min(1.0, coeffs[0] * 100.0))
-        else:
-            curvature_score = 0.0
-        
-        # Combined positive feedback score
-        feedback = 0.4 * correlation + 0.3 * acceleration_score + 0.3 * curvature_score
-        
-        return feedback
+        return _positive_feedback(
+            np.asarray(risk_series, dtype=np.float64),
+            np.asarray(trend_series, dtype=np.float64)
+        )
     
     def _compute_divergence_rate(self, risk_series: np.ndarray) -> float:
         """
@@ -362,16 +505,8 @@ class Phase3ChaosKernel:
         if len(risk_series) < 10:
             return 0.0
         
-        # Baseline (early readings)
-        baseline = np.mean(risk_series[:min(10, len(risk_series) // 3)])
-        
-        # Current state (recent readings)
-        current = np.mean(risk_series[-10:])
-        
-        # Divergence (normalized)
-        divergence = (current - baseline) / (baseline + 0.01)
-        
-        return max(0.0, divergence)
+        # Baseline (early readings) vs current state (recent readings)
+        return _divergence_rate(np.asarray(risk_series, dtype=np.float64))
     
     def _compute_suspicion_level(self,
                                 lyapunov: float,
@@ -409,7 +544,9 @@ class Phase3ChaosKernel:
     def reset(self):
         """Reset chaos kernel (clear history buffer)"""
         self.risk_score_history.clear()
+        self.trend_history.clear()
         self.last_analysis = None
+        self._stable_streak = 0
     
     def get_statistics(self) -> Dict:
         """Get chaos kernel statistics"""
@@ -16,6 +16,7 @@ Philosophy: "Trust, but Verify"
 NO SIMULATED DATA - Works only with real camera frames from ESP32-CAM
 """
 
+import zlib
 import numpy as np
 from typing import Dict, Tuple, Optional
 from dataclasses import dataclass
@@ -134,8 +135,7 @@ class Phase4VisionMamba:
         self.baseline_sharpness = None
         self.baseline_variance = None
         
-        # Previous frame for frozen detection
-        self.previous_frame = None
+        # Fingerprint of the previous frame for frozen detection
         self.previous_frame_hash = None
         
         # Statistics
@@ -155,10 +155,18 @@ class Phase4VisionMamba:
         Returns:
             VisionMambaOutput with health status and smoke analysis
         """
+        # 8-bit and grayscale once per frame; both the health check and the
+        # spectral gate work on them
+        if self._check_frame_valid(camera_frame):
+            camera_frame = self._to_uint8(camera_frame)
+            gray = self._to_gray(camera_frame)
+        else:
+            gray = None
+        
         # =====================================================================
         # STAGE 1: CAMERA HEALTH CHECK (First Gate)
         # =====================================================================
-        camera_health = self._check_camera_health(camera_frame, timestamp)
+        camera_health = self._check_camera_health(camera_frame, timestamp, gray)
         
         # =====================================================================
         # STAGE 2: DETERMINE VISION MODE
@@ -178,7 +186,7 @@ class Phase4VisionMamba:
         # =====================================================================
         # STAGE 3: SPECTRAL GATE (Smoke Analysis)
         # =====================================================================
-        smoke_analysis = self._spectral_gate(camera_frame, timestamp)
+        smoke_analysis = self._spectral_gate(camera_frame, timestamp, gray)
         
         # =====================================================================
         # STAGE 4: DETERMINE OUTPUT MODE AND WEIGHTS
@@ -210,7 +218,8 @@ class Phase4VisionMamba:
     
     def _check_camera_health(self, 
                             frame: np.ndarray, 
-                            timestamp: datetime) -> CameraHealthStatus:
+                            timestamp: datetime,
+                            gray: Optional[np.ndarray] = None) -> CameraHealthStatus:
         """
         Self-diagnostic camera health check
         
@@ -223,6 +232,7 @@ class Phase4VisionMamba:
         Args:
             frame: Camera frame to check
             timestamp: Current timestamp
+            gray: Grayscale version of frame, if already computed
         
         Returns:
             CameraHealthStatus with diagnostic results
@@ -239,7 +249,7 @@ class Phase4VisionMamba:
         brightness_ok = True
         
         if frame_valid:
-            exposure_ok, brightness_ok = self._check_exposure_and_brightness(frame)
+            exposure_ok, brightness_ok = self._check_exposure_and_brightness(frame, gray)
             
             if not exposure_ok:
                 failure_reasons.append("exposure_failure")
@@ -300,18 +310,39 @@ class Phase4VisionMamba:
         
         return True
     
-    def _check_exposure_and_brightness(self, frame: np.ndarray) -> Tuple[bool, bool]:
+    def _to_uint8(self, frame: np.ndarray) -> np.ndarray:
+        """
+        8-bit version of a frame (no copy if it already is one)
+        
+        The brightness limits, the 256-bin histogram and the CV_16S
+        Laplacian all assume 0-255 pixels. Float frames in [0, 1] are
+        rescaled; anything else is clipped to 0-255.
+        """
+        if frame.dtype == np.uint8:
+            return frame
+        
+        if frame.dtype.kind == 'f' and frame.max() <= 1.0:
+            frame = frame * 255.0
+        
+        return np.clip(frame, 0, 255).astype(np.uint8)
+    
+    def _to_gray(self, frame: np.ndarray) -> np.ndarray:
+        """Grayscale view of an RGB or already-gray frame"""
+        if len(frame.shape) == 3:
+            return cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY)
+        return frame
+    
+    def _check_exposure_and_brightness(self,
+                                       frame: np.ndarray,
+                                       gray: Optional[np.ndarray] = None) -> Tuple[bool, bool]:
         """
         Check if exposure and brightness are in acceptable range
         
         Returns:
             (exposure_ok, brightness_ok)
         """
-        # Convert to grayscale if RGB
-        if len(frame.shape) == 3:
-            gray = cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY)
-        else:
-            gray = frame
+        if gray is None:
+            gray = self._to_gray(frame)
         
         # Compute mean brightness
         mean_brightness = np.mean(gray)
@@ -328,28 +359,28 @@ class Phase4VisionMamba:
         """
         Check if frame is frozen (identical to previous frame)
         
-        Computes hash of current frame and compares to previous
+        Computes a CRC-32 of the current frame straight from its buffer and
+        compares it to the previous one; the frame itself is never copied
         """
-        if self.previous_frame is None:
-            self.previous_frame = frame.copy()
-            self.previous_frame_hash = hash(frame.tobytes())
-            return True  # First frame, assume not frozen
+        if not frame.flags.c_contiguous:
+            frame = np.ascontiguousarray(frame)
+        current_hash = zlib.crc32(frame)
         
-        # Compute hash of current frame
-        current_hash = hash(frame.tobytes())
+        if self.previous_frame_hash is None:
+            self.previous_frame_hash = current_hash
+            return True  # First frame, assume not frozen
         
         # If identical to previous, might be frozen
         is_frozen = (current_hash == self.previous_frame_hash)
         
-        # Update previous frame
-        self.previous_frame = frame.copy()
         self.previous_frame_hash = current_hash
         
         return not is_frozen
     
     def _spectral_gate(self, 
                       frame: np.ndarray, 
-                      timestamp: datetime) -> SmokeAnalysisResult:
+                      timestamp: datetime,
+                      gray: Optional[np.ndarray] = None) -> SmokeAnalysisResult:
         """
         Spectral Gate: Classical computer vision smoke detection
         
@@ -366,15 +397,14 @@ class Phase4VisionMamba:
         Args:
             frame: RGB camera frame
             timestamp: Current timestamp
+            gray: Grayscale version of frame, if already computed
         
         Returns:
             SmokeAnalysisResult with confidence and features
         """
         # Convert to grayscale
-        if len(frame.shape) == 3:
-            gray = cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY)
-        else:
-            gray = frame
+        if gray is None:
+            gray = self._to_gray(frame)
         
         # 1. Edge Detection (Laplacian for blur detection)
         edge_sharpness = self._compute_edge_sharpness(gray)
@@ -419,11 +449,13 @@ class Phase4VisionMamba:
         Returns:
             Sharpness score (0.0-1.0), normalized
         """
-        # Laplacian edge detection
-        laplacian = cv2.Laplacian(gray, cv2.CV_64F)
+        # Laplacian edge detection (3x3 on uint8 stays within ±1020, so
+        # 16-bit integer output is exact and a quarter the size of float64)
+        laplacian = cv2.Laplacian(gray, cv2.CV_16S)
         
         # Variance of Laplacian (focus measure)
-        variance = laplacian.var()
+        _, stddev = cv2.meanStdDev(laplacian)
+        variance = stddev[0, 0] ** 2
         
         # Normalize to [0, 1] (empirical max ~500 for typical scenes)
         sharpness = min(1.0, variance / 500.0)
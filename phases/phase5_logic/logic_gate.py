@@ -42,12 +42,13 @@ class SystemState(Enum):
     CONFIRMED = "confirmed"  # Fire confirmed, alerting
 
 
-@dataclass
+@dataclass(slots=True)
 class PhaseInputs:
     """
     Consolidated inputs from all phases
     
-    All values normalized to [0, 1] risk contributions
+    All values normalized to [0, 1] risk contributions. Mutable so a
+    long-running caller can refill one instance every cycle.
     """
     # Phase-0: Sensor fusion
     fire_risk_score: float = 0.0
@@ -519,22 +520,18 @@ class Phase5LogicGate:
         Returns:
             Number of witnesses confirming
         """
-        # Filter neighbors within radius
-        nearby_neighbors = [
-            n for n in neighbor_nodes
-            if hasattr(n, 'distance') and n.distance <= self.witness_radius_meters
-        ]
-        
-        if not nearby_neighbors:
-            return 0
-        
-        # Count confirmations
-        # In real implementation, this would send actual network requests
-        # Here we check if neighbors have high risk scores
-        witnesses_confirming = sum(
-            1 for n in nearby_neighbors
-            if hasattr(n, 'risk_score') and n.risk_score > 0.40
-        )
+        radius = self.witness_radius_meters
+        witnesses_confirming = 0
+        
+        # One pass: neighbors within radius whose risk confirms ours.
+        # In real implementation, this would send actual network requests;
+        # here we check if neighbors have high risk scores
+        for n in neighbor_nodes:
+            distance = getattr(n, 'distance', None)
+            if distance is None or distance > radius:
+                continue
+            if getattr(n, 'risk_score', 0.0) > 0.40:
+                witnesses_confirming += 1
         
         return witnesses_confirming
     
@@ -430,7 +430,7 @@ class Phase6CommunicationLayer:
         
         # Try satellite transmission
         if self._transmit_satellite(alert):
-            self.logger.critical(f"🛰️ P1 CRITICAL ALERT via SATELLITE: {alert_id}")
+            self.logger.critical("🛰️ P1 CRITICAL ALERT via SATELLITE: %s", alert_id)
             self.stats['satellite_transmissions'] += 1
             alert.metadata['transmission_success'] = True
         else:
@@ -491,7 +491,7 @@ class Phase6CommunicationLayer:
         
         # Mesh broadcast
         self._transmit_lora_mesh(alert)
-        self.logger.warning(f"📡 P2 MEDIUM ALERT via MESH: {alert_id}")
+        self.logger.warning("📡 P2 MEDIUM ALERT via MESH: %s", alert_id)
         
         # Update trauma (lower than P1)
         self.global_trauma_level = min(1.0, self.global_trauma_level + 0.15)
@@ -547,7 +547,7 @@ class Phase6CommunicationLayer:
         
         # LoRa transmission
         self._transmit_lora_mesh(alert)
-        self.logger.info(f"🔧 P3 MAINTENANCE: {alert_id} - {issue}")
+        self.logger.info("🔧 P3 MAINTENANCE: %s - %s", alert_id, issue)
         
         # Record alert
         self.alerts_sent.append(alert)
@@ -613,7 +613,7 @@ class Phase6CommunicationLayer:
         # Emergency satellite transmission
         self._transmit_satellite(alert)
         
-        self.logger.critical(f"💀 DYING GASP: {alert_id} - Temperature: {temperature}°C")
+        self.logger.critical("💀 DYING GASP: %s - Temperature: %s°C", alert_id, temperature)
         
         # Record death event
         death_event = DeathEvent(
@@ -655,7 +655,7 @@ class Phase6CommunicationLayer:
         # rb.send_message(message)
         
         # For now, log the transmission
-        self.logger.info(f"🛰️ Satellite TX: {alert.alert_id}")
+        self.logger.info("🛰️ Satellite TX: %s", alert.alert_id)
         
         # Simulate transmission success
         return True
@@ -691,7 +691,7 @@ class Phase6CommunicationLayer:
         # rfm9x.send(message)
         
         # For now, log the transmission
-        self.logger.info(f"📡 LoRa MESH TX: {alert.alert_id}")
+        self.logger.info("📡 LoRa MESH TX: %s", alert.alert_id)
         
         return True
     
@@ -776,7 +776,7 @@ class Phase6CommunicationLayer:
             self.last_trauma_decay = now
             
             if self.global_trauma_level > 0:
-                self.logger.debug(f"Trauma decayed to {self.global_trauma_level:.2%}")
+                self.logger.debug("Trauma decayed to %.2f%%", self.global_trauma_level * 100)
     
     def update_node_status(self, node_status: NodeStatus):
         """
@@ -827,7 +827,7 @@ class Phase6CommunicationLayer:
         # Update death vectors
         self._update_death_vectors(death_event)
         
-        self.logger.warning(f"💀 Node {node_status.node_id} marked DEAD")
+        self.logger.warning("💀 Node %s marked DEAD", node_status.node_id)
     
     def check_known_burnt_area(self, location: GPSCoordinate) -> bool:
         """
@@ -864,7 +864,7 @@ class Phase6CommunicationLayer:
             radius: Radius in meters
         """
         self.burnt_areas.append((location, radius, datetime.now()))
-        self.logger.info(f"🔥 Burnt area added: radius {radius}m")
+        self.logger.info("🔥 Burnt area added: radius %sm", radius)
     
     def get_fire_spread_prediction(self,
                                    current_location: GPSCoordinate,
@@ -1251,9 +1251,9 @@ class MeshNetwork:
                 self.queen_node_id = node_id  # first Queen is primary
             if node_id not in self.queen_node_ids:
                 self.queen_node_ids.append(node_id)
-            self.logger.info(f"👑 QUEEN node registered: {node_id} (total: {len(self.queen_node_ids)})")
+            self.logger.info("👑 QUEEN node registered: %s (total: %d)", node_id, len(self.queen_node_ids))
         else:
-            self.logger.info(f"🐝 DRONE node registered: {node_id}")
+            self.logger.info("🐝 DRONE node registered: %s", node_id)
     
     def route_message(self, message: MeshMessage) -> bool:
         """
@@ -1278,7 +1278,7 @@ class MeshNetwork:
         
         source_node = self.nodes.get(message.source_node_id)
         if not source_node:
-            self.logger.warning(f"Unknown source node: {message.source_node_id}")
+            self.logger.warning("Unknown source node: %s", message.source_node_id)
             return False
         
         # Drone → Queen routing
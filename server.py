@@ -62,6 +62,7 @@ app.add_middleware(
 # REAL DATA INTERFACE (FLAME/UFFD Ingestion)
 # ============================================================================
 import csv
+import numpy as np
 
 # Helper Class for validation format
 class MockReading:
@@ -74,21 +75,33 @@ class MockReading:
 
 class RealDataInterface:
     def __init__(self, mission_file="data/real/black_summer_mission.csv"):
-        self.data_rows = []
+        # Only a handful of columns are ever read, so parse them once into
+        # flat arrays instead of keeping a dict of strings per row
+        self.n_frames = 0
         # Start at the edge of fire detection for maximum jury impact (Row 320 = Instant Orange -> Red)
         self.current_idx = 320 
         try:
-            with open(mission_file, 'r') as f:
-                reader = csv.DictReader(f)
-                self.data_rows = list(reader)
-            print(f"✅ Loaded {len(self.data_rows)} frames of BLACK SUMMER MEGA-FIRE data.")
+            with open(mission_file, 'r', newline='') as f:
+                thermal, visual, lat, lng, images = [], [], [], [], []
+                for row in csv.DictReader(f):
+                    thermal.append(row['thermal_score'])
+                    visual.append(row['visual_score'])
+                    lat.append(row.get('lat', -35.72)) # Deua National Park (Black Summer bushland)
+                    lng.append(row.get('lng', 150.10))
+                    images.append(row['image_filename'])
+            self.thermal = np.asarray(thermal, dtype=np.float64)
+            self.visual = np.asarray(visual, dtype=np.float64)
+            self.lat = np.asarray(lat, dtype=np.float64)
+            self.lng = np.asarray(lng, dtype=np.float64)
+            self.image_filenames = images
+            self.n_frames = len(images)
+            print(f"✅ Loaded {self.n_frames} frames of BLACK SUMMER MEGA-FIRE data.")
         except FileNotFoundError:
             print(f"⚠️  Mission file {mission_file} not found. Running setup script...")
             # Fallback: generating on the fly if missing
-            self.data_rows = []
 
         # Fallback if file load failed
-        if not self.data_rows:
+        if not self.n_frames:
             print("⚠️  No data loaded. System will run in IDLE mode.")
             self.fallback = None
         else:
@@ -96,7 +109,7 @@ class RealDataInterface:
 
     def read_sensors(self) -> Dict:
         """Stream next row from Real Data CSV"""
-        if not self.data_rows:
+        if not self.n_frames:
             # Safe default if no data
             return {
                 'VOC': None,
@@ -105,16 +118,16 @@ class RealDataInterface:
                 'CAMERA_BRIGHTNESS': None
             }
 
-        row = self.data_rows[self.current_idx]
+        idx = self.current_idx
         
         # Advance index (loop back to start for booth demo)
-        self.current_idx = (self.current_idx + 1) % len(self.data_rows)
+        self.current_idx = (idx + 1) % self.n_frames
         
-        # Parse Real Values
-        thermal_val = float(row['thermal_score'])
-        visual_val = float(row['visual_score'])
-        lat_val = float(row.get('lat', -35.72)) # Deua National Park (Black Summer bushland)
-        lng_val = float(row.get('lng', 150.10))
+        # Real values (parsed at load)
+        thermal_val = float(self.thermal[idx])
+        visual_val = float(self.visual[idx])
+        lat_val = float(self.lat[idx])
+        lng_val = float(self.lng[idx])
         # Offset coordinates ~7km WNW into Deua National Park bushland
         # (CSV originals are near Batemans Bay township / coastal water)
         lat_val = lat_val + 0.01   # shift slightly south
@@ -124,9 +137,10 @@ class RealDataInterface:
 
         # Construct image URL if present
         img_url = ""
-        if row['image_filename']:
+        image_filename = self.image_filenames[idx]
+        if image_filename:
             # Points to the static file server route
-            img_url = f"/api/images/{row['image_filename']}"
+            img_url = f"/api/images/{image_filename}"
 
         return {
             # Normalize keys to match Processor expectations
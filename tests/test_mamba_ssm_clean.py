@@ -245,6 +245,47 @@ def test_update_pipeline():
     print("✅ Complete update pipeline validated")
 
 
+def test_update_batch_matches_update():
+    """Test that batched replay matches tick-by-tick updates"""
+    print("\n" + "="*70)
+    print("📦 TESTING BATCHED TRAJECTORY REPLAY")
+    print("="*70)
+    
+    rng = np.random.default_rng(7)
+    n = 150  # More ticks than the history ring holds
+    chemical, visual, environmental = rng.random(n), rng.random(n), rng.random(n)
+    
+    # Irregular spacing, including gaps outside the 0.1-10 s clamp
+    start = datetime(2024, 1, 1)
+    offsets = np.cumsum(rng.uniform(0.05, 15.0, n))
+    timestamps = [start + timedelta(seconds=float(t)) for t in offsets]
+    
+    # Same random projections for both SSMs
+    np.random.seed(0)
+    ssm = MambaSSM()
+    expected = []
+    for i in range(n):
+        ssm.update(chemical[i], visual[i], environmental[i], timestamps[i])
+        expected.append(ssm.get_perceptual_score()['fused_score'])
+    
+    np.random.seed(0)
+    batched = MambaSSM()
+    fused = batched.update_batch(chemical, visual, environmental, timestamps)
+    
+    print(f"\nMax fused-score difference: {np.max(np.abs(fused - expected)):.2e}")
+    
+    assert fused.shape == (n,), "Should return one fused score per tick"
+    assert np.allclose(fused, expected, rtol=0.0, atol=1e-6), \
+        "Batched replay should match per-tick update()"
+    assert np.allclose(batched.state.h, ssm.state.h, rtol=0.0, atol=1e-6), \
+        "Should leave the same hidden state"
+    assert batched.state.timestamp == ssm.state.timestamp, "Should store last timestamp"
+    assert batched.update_count == ssm.update_count, "Should count every tick"
+    assert len(batched.history_buffer) == len(ssm.history_buffer), "Should fill history"
+    
+    print("✅ Batched replay matches per-tick updates")
+
+
 def run_all_tests():
     """Run all validation tests"""
     print("\n" + "🧪"*35)
@@ -263,6 +304,7 @@ def run_all_tests():
         test_state_transition()
         test_perceptual_score_computation()
         test_update_pipeline()
+        test_update_batch_matches_update()
         
         print("\n" + "="*70)
         print("✅ ALL LOGIC VALIDATION TESTS PASSED!")
@@ -300,6 +300,50 @@ def test_phase3_suspicion_level():
     print("✅ Phase-3 suspicion level tests passed!")
 
 
+def test_phase3_calm_gate():
+    """Test the calm-cycle gate and monitoring stub"""
+    print("\n" + "="*70)
+    print("⚡ TESTING PHASE-3: CALM-CYCLE GATE")
+    print("="*70)
+    
+    print("\nTest validates that:")
+    print("  • Full analysis is required until a stable streak builds up")
+    print("  • Calm cycles need near-zero risk AND near-zero trend")
+    print("  • The stub records the sample and carries the last analysis")
+    
+    # No stable streak yet: always analyse
+    chaos_kernel = Phase3ChaosKernel()
+    assert chaos_kernel.quick_gate(0.0, 0.0), "Fresh kernel should require full analysis"
+    
+    # Streak satisfied: only the risk/trend thresholds decide
+    chaos_kernel = Phase3ChaosKernel(calm_streak=0)
+    assert not chaos_kernel.quick_gate(0.05, 0.0), "Calm cycle should skip analysis"
+    assert chaos_kernel.quick_gate(0.5, 0.0), "Elevated risk should require analysis"
+    assert chaos_kernel.quick_gate(0.05, 0.5), "Strong trend should require analysis"
+    
+    # Stub after a full analysis
+    timestamp = datetime.now()
+    for i in range(50):
+        chaos_kernel.update(0.5 + np.random.randn() * 0.1,
+                            np.random.randn() * 0.05,
+                            timestamp + timedelta(seconds=i))
+    last = chaos_kernel.last_analysis
+    analyses = chaos_kernel.analysis_count
+    
+    stub = chaos_kernel.monitor_stub(0.05, 0.0, timestamp + timedelta(seconds=50))
+    
+    assert isinstance(stub, ChaosAnalysisResult), "Stub should return ChaosAnalysisResult"
+    assert len(chaos_kernel.risk_score_history) == 51, "Stub should record the sample"
+    assert len(chaos_kernel.trend_history) == 51, "Stub should record the trend"
+    assert chaos_kernel.analysis_count == analyses, "Stub should not count as an analysis"
+    assert not stub.is_unstable, "Stub should never report instability"
+    assert stub.samples_analyzed == 0, "Stub should analyse no samples"
+    assert stub.lyapunov_exponent == last.lyapunov_exponent, "Stub should carry last λ"
+    assert stub.suspicion_level == last.suspicion_level, "Stub should carry last suspicion"
+    
+    print("✅ Phase-3 calm-cycle gate tests passed!")
+
+
 def test_phase_integration():
     """Test integration between Phase-2 and Phase-3"""
     print("\n" + "="*70)
@@ -362,6 +406,7 @@ def run_all_tests():
         test_phase3_positive_feedback_detection()
         test_phase3_divergence_rate()
         test_phase3_suspicion_level()
+        test_phase3_calm_gate()
         
         # Integration tests
         test_phase_integration()
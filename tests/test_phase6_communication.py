@@ -18,6 +18,7 @@ from phase6_communication_layer import (
     DeathVector,
     DigitalTwinState
 )
+from hardware.integration_guide import _parse_gga
 
 
 def test_gps_distance_calculation():
@@ -55,6 +56,53 @@ def test_gps_distance_calculation():
     print("✅ GPS distance calculation validated!")
 
 
+def test_gga_sentence_parsing():
+    """Test $GPGGA parsing used for the node's alert location"""
+    print("\n" + "="*70)
+    print("🛰️  TESTING GPGGA SENTENCE PARSING")
+    print("="*70)
+    
+    def sentence(body):
+        """Frame a GGA body with its XOR checksum"""
+        checksum = 0
+        for c in body.encode():
+            checksum ^= c
+        return f"${body}*{checksum:02X}".encode()
+    
+    # Reference sentence: 48°07.038' N, 11°31.000' E, 545.4 m
+    fix = _parse_gga(b"$GPGGA,123519,4807.038,N,01131.000,E,1,08,0.9,545.4,M,46.9,M,,*47")
+    assert fix is not None, "Valid sentence should parse"
+    lat, lon, alt = fix
+    print(f"\nN/E fix: {lat:.5f}, {lon:.5f}, {alt} m")
+    assert abs(lat - 48.1173) < 1e-9, "Latitude should convert ddmm.mmm to degrees"
+    assert abs(lon - 11.516666667) < 1e-6, "Longitude should convert dddmm.mmm to degrees"
+    assert alt == 545.4, "Altitude should be field 9"
+    
+    # Southern / western hemispheres are negative
+    lat, lon, alt = _parse_gga(sentence(
+        "GPGGA,010203,3351.600,S,15112.600,W,1,05,1.2,12.0,M,0.0,M,,"
+    ))
+    print(f"S/W fix: {lat:.5f}, {lon:.5f}, {alt} m")
+    assert abs(lat + 33.86) < 1e-9, "South should be negative latitude"
+    assert abs(lon + 151.21) < 1e-9, "West should be negative longitude"
+    
+    # Corrupted sentence: checksum mismatch
+    assert _parse_gga(b"$GPGGA,123519,4807.038,N,01131.000,E,1,08,0.9,545.4,M,46.9,M,,*48") is None, \
+        "Bad checksum should be rejected"
+    
+    # No fix yet: receiver leaves the position fields empty
+    assert _parse_gga(sentence("GPGGA,123519,,,,,0,00,99.9,,M,,M,,")) is None, \
+        "Sentence without a fix should return None"
+    
+    # Missing altitude
+    lat, lon, alt = _parse_gga(sentence(
+        "GPGGA,123519,4807.038,N,01131.000,E,1,08,0.9,,M,46.9,M,,"
+    ))
+    assert alt is None, "Empty altitude should be None"
+    
+    print("✅ GPGGA parsing validated!")
+
+
 def test_priority_determination():
     """Test alert priority logic"""
     print("\n" + "="*70)
@@ -548,6 +596,7 @@ def run_all_tests():
     
     try:
         test_gps_distance_calculation()
+        test_gga_sentence_parsing()
         test_priority_determination()
         test_alert_routing()
         test_dying_gasp_protocol()